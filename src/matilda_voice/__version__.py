@@ -1,16 +1,21 @@
-import tomllib
-from importlib import metadata
-from pathlib import Path
+import functools
+from typing import Any
 
 
+@functools.cache
 def _get_version() -> str:
     """Read version from package metadata or pyproject.toml."""
+    from importlib import metadata
+
     try:
         return metadata.version("goobits-matilda-voice")
     except Exception:
         pass
 
     try:
+        import tomllib
+        from pathlib import Path
+
         pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
         with open(pyproject_path, "rb") as f:
             data = tomllib.load(f)
@@ -19,4 +24,9 @@ def _get_version() -> str:
         return "unknown"
 
 
-__version__ = _get_version()
+def __getattr__(name: str) -> Any:
+    # Resolve __version__ on first access (PEP 562) so importing the package
+    # does not pay for a metadata lookup or a pyproject.toml parse.
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
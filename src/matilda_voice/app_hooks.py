@@ -19,6 +19,7 @@ from matilda_voice.hooks import (
     on_install,
     on_providers,
     on_save,
+    on_save_async,
     # Core
     on_speak,
     # System
@@ -44,6 +45,7 @@ __all__ = [
     # Core
     "on_speak",
     "on_save",
+    "on_save_async",
     # Providers
     "on_voices",
     "on_providers",
@@ -1,7 +1,8 @@
 """Abstract base class for TTS providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 from .internal.types import ProviderInfo
 
@@ -14,6 +15,9 @@ class TTSProvider(ABC):
     text-to-speech synthesis using their respective APIs or engines.
     """
 
+    # True when asynthesize() awaits the provider directly instead of falling back to a thread
+    native_async: ClassVar[bool] = False
+
     @abstractmethod
     def synthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
         """Synthesize speech from text and save to output path.
@@ -42,6 +46,22 @@ class TTSProvider(ABC):
         """
         pass
 
+    async def asynthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
+        """Async counterpart of :meth:`synthesize` for callers running an event loop.
+
+        The default runs :meth:`synthesize` in a worker thread. Providers with a native
+        async HTTP client override it so concurrent requests don't each hold a thread.
+        """
+        await asyncio.to_thread(self.synthesize, text, output_path, **kwargs)
+
+    def close(self) -> None:
+        """Release pooled resources such as HTTP clients. The default holds none."""
+        return None
+
+    async def aclose(self) -> None:
+        """Async counterpart of :meth:`close` that also closes clients bound to the event loop."""
+        self.close()
+
     def get_info(self) -> Optional[ProviderInfo]:
         """Get provider information including available voices and capabilities.
 
@@ -1,7 +1,11 @@
 """Core TTS engine functionality separated from CLI concerns."""
 
+import asyncio
+import functools
+import importlib
 import logging
 import os
+import weakref
 from pathlib import Path
 from typing import Any, Dict, Optional, Type
 
@@ -11,6 +15,26 @@ from .internal.config import CONFIG_DEFAULTS, get_api_key, load_config, parse_vo
 from .internal.types import ProviderInfo
 
 
+@functools.cache
+def _import_provider_class(module_path: str) -> Type[TTSProvider]:
+    """Import a provider module and return its provider class, once per process."""
+    module = importlib.import_module(module_path)
+
+    # Built-in providers name their class explicitly; other modules are scanned
+    # for a class that inherits from TTSProvider
+    provider_class = getattr(module, "PROVIDER_CLASS", None)
+    if provider_class is None:
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if isinstance(attr, type) and issubclass(attr, TTSProvider) and attr is not TTSProvider:
+                provider_class = attr
+                break
+
+    if not (isinstance(provider_class, type) and issubclass(provider_class, TTSProvider)):
+        raise ProviderLoadError(f"No TTSProvider subclass found in module {module_path}")
+    return provider_class
+
+
 class TTSEngine:
     """Core TTS engine that handles synthesis without CLI dependencies."""
 
@@ -23,6 +47,11 @@ class TTSEngine:
         self.providers_registry = providers_registry
         self.logger = logging.getLogger(__name__)
         self._loaded_providers: Dict[str, Type[TTSProvider]] = {}
+        # Native-async providers are reused so their HTTP clients keep connections alive. Async
+        # clients and semaphores are bound to one event loop, hence one set of instances per loop.
+        self._async_providers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, TTSProvider]]" = (
+            weakref.WeakKeyDictionary()
+        )
 
     def load_provider(self, name: str) -> Type[TTSProvider]:
         """Load a TTS provider by name using the existing loader.
@@ -47,23 +76,7 @@ class TTSEngine:
         module_path = self.providers_registry[name]
 
         try:
-            # Import the provider module dynamically
-            import importlib
-
-            module = importlib.import_module(module_path)
-
-            # Find the provider class in the module
-            # Look for a class that inherits from TTSProvider
-            provider_class = None
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if isinstance(attr, type) and issubclass(attr, TTSProvider) and attr is not TTSProvider:
-                    provider_class = attr
-                    break
-
-            if not provider_class:
-                raise ProviderLoadError(f"No TTSProvider subclass found in module {module_path}")
-
+            provider_class = _import_provider_class(module_path)
             self._loaded_providers[name] = provider_class
             return provider_class
 
@@ -76,35 +89,14 @@ class TTSEngine:
         """Get list of available provider names."""
         return list(self.providers_registry.keys())
 
-    def synthesize_text(
-        self,
-        text: str,
-        output_path: Optional[str] = None,
-        provider_name: Optional[str] = None,
-        voice: Optional[str] = None,
-        stream: bool = True,
-        output_format: str = "wav",
-        **kwargs: Any,
-    ) -> Optional[str]:
-        """Synthesize text to speech.
+    def _resolve_provider_and_voice(
+        self, provider_name: Optional[str], voice: Optional[str]
+    ) -> tuple[str, Optional[str]]:
+        """Work out which provider to use and the provider-local voice name.
 
-        Args:
-            text: Text to synthesize
-            output_path: Path to save audio file (if None and stream=False, auto-generate)
-            provider_name: Specific provider to use (if None, auto-detect from voice)
-            voice: Voice to use (provider:voice format or just voice name)
-            stream: Whether to stream audio to speakers
-            output_format: Audio output format
-            **kwargs: Additional provider-specific options
-
-        Returns:
-            Path to generated audio file if saved, None if streamed
-
-        Raises:
-            TTSError: If synthesis fails
-            ProviderNotFoundError: If specified provider not found
+        An explicit provider takes precedence; otherwise it is detected from a
+        ``provider:voice`` setting, then the configured default voice.
         """
-        # Load configuration
         config = load_config()
 
         # Determine voice and provider
@@ -142,7 +134,37 @@ class TTSEngine:
         if not provider_name:
             # Fallback to default provider if no provider detected
             provider_name = str(CONFIG_DEFAULTS["default_provider"])
-        assert provider_name is not None
+        return provider_name, voice
+
+    def synthesize_text(
+        self,
+        text: str,
+        output_path: Optional[str] = None,
+        provider_name: Optional[str] = None,
+        voice: Optional[str] = None,
+        stream: bool = True,
+        output_format: str = "wav",
+        **kwargs: Any,
+    ) -> Optional[str]:
+        """Synthesize text to speech.
+
+        Args:
+            text: Text to synthesize
+            output_path: Path to save audio file (if None and stream=False, auto-generate)
+            provider_name: Specific provider to use (if None, auto-detect from voice)
+            voice: Voice to use (provider:voice format or just voice name)
+            stream: Whether to stream audio to speakers
+            output_format: Audio output format
+            **kwargs: Additional provider-specific options
+
+        Returns:
+            Path to generated audio file if saved, None if streamed
+
+        Raises:
+            TTSError: If synthesis fails
+            ProviderNotFoundError: If specified provider not found
+        """
+        provider_name, voice = self._resolve_provider_and_voice(provider_name, voice)
 
         # Load and instantiate provider
         try:
@@ -187,6 +209,68 @@ class TTSEngine:
         except (IOError, OSError, RuntimeError, ValueError) as e:
             self.logger.error(f"Synthesis failed: {e}")
             raise TTSError(f"Synthesis failed: {e}") from e
+        finally:
+            provider.close()
+
+    def provider_supports_async(self, provider_name: str) -> bool:
+        """Whether the provider awaits synthesis natively (see TTSProvider.native_async)."""
+        try:
+            return self.load_provider(provider_name).native_async
+        except (ProviderNotFoundError, ProviderLoadError):
+            return False
+
+    async def asynthesize_text(
+        self,
+        text: str,
+        output_path: str,
+        provider_name: Optional[str] = None,
+        voice: Optional[str] = None,
+        output_format: str = "wav",
+        **kwargs: Any,
+    ) -> str:
+        """Async counterpart of :meth:`synthesize_text` for saving to a file.
+
+        Provider instances are kept per event loop, so providers with a native
+        async client reuse its connections across calls.
+
+        Returns:
+            output_path, once the file has been written
+
+        Raises:
+            TTSError: If synthesis fails
+        """
+        provider_name, voice = self._resolve_provider_and_voice(provider_name, voice)
+
+        loop_providers = self._async_providers.setdefault(asyncio.get_running_loop(), {})
+        provider = loop_providers.get(provider_name)
+        if provider is None:
+            try:
+                provider = self.load_provider(provider_name)()
+            except (ProviderNotFoundError, ProviderLoadError) as e:
+                self.logger.error(f"Failed to load provider {provider_name}: {e}")
+                raise TTSError(f"Provider {provider_name} unavailable: {e}") from e
+            loop_providers[provider_name] = provider
+
+        synthesis_kwargs = {"stream": False, "output_format": output_format, **kwargs}
+        if voice is not None:
+            synthesis_kwargs["voice"] = voice
+
+        self.logger.info(f"Synthesizing audio to {output_path} with {provider_name} provider")
+        try:
+            await provider.asynthesize(text, output_path, **synthesis_kwargs)
+        except (IOError, OSError, RuntimeError, ValueError) as e:
+            self.logger.error(f"Synthesis failed: {e}")
+            raise TTSError(f"Synthesis failed: {e}") from e
+
+        if not Path(output_path).exists():
+            raise TTSError("Synthesis completed but output file not found")
+        return output_path
+
+    async def aclose_async_providers(self) -> None:
+        """Close the providers kept for the running event loop, e.g. on server shutdown."""
+        loop_providers = self._async_providers.pop(asyncio.get_running_loop(), {})
+        for provider in loop_providers.values():
+            await provider.aclose()
 
     def get_provider_info(self, provider_name: str) -> Optional[ProviderInfo]:
         """Get information about a specific provider.
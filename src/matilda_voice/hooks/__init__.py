@@ -3,7 +3,7 @@
 Hooks module for TTS CLI business logic.
 
 This module provides all hook handlers for the CLI commands:
-- core: on_speak, on_save (main synthesis handlers)
+- core: on_speak, on_save, on_save_async (main synthesis handlers)
 - providers: on_voices, on_providers, on_install, on_info
 - voice: on_voice_load, on_voice_unload, on_voice_status
 - system: on_status, on_config
@@ -11,7 +11,7 @@ This module provides all hook handlers for the CLI commands:
 - utils: helper functions and registries
 """
 
-from .core import on_save, on_speak
+from .core import on_save, on_save_async, on_speak
 from .document import on_document
 from .providers import on_info, on_install, on_providers, on_voices
 from .system import on_config, on_status
@@ -35,6 +35,7 @@ __all__ = [
     # Core
     "on_speak",
     "on_save",
+    "on_save_async",
     # Providers
     "on_voices",
     "on_providers",
@@ -14,6 +14,40 @@ from .utils import (
 )
 
 
+def _split_provider_shortcut(text: Optional[str], options: tuple[str, ...]) -> tuple[Optional[str], list[str]]:
+    """Split a leading @provider shortcut off the text/options arguments.
+
+    Returns the provider name (None if no shortcut was given) and the remaining text arguments.
+    """
+    provider_name = None
+    all_args = []
+
+    # Collect all arguments
+    if text:
+        all_args.append(text)
+    if options:
+        all_args.extend(options)
+
+    # Check if first argument is a provider shortcut
+    if all_args and all_args[0].startswith("@"):
+        provider_name, remaining_args = parse_provider_shortcuts(all_args)
+        # Handle invalid shortcuts
+        if provider_name and provider_name.startswith("@"):
+            shortcut = provider_name[1:]
+            exit_with_message(
+                "\n".join(
+                    [
+                        f"Error: Unknown provider shortcut '@{shortcut}'",
+                        f"Available providers: {', '.join('@' + k for k in PROVIDER_SHORTCUTS.keys())}",
+                    ]
+                ),
+                exit_code=1,
+            )
+        all_args = remaining_args
+
+    return provider_name, all_args
+
+
 def on_speak(
     text: Optional[str],
     options: tuple[str, ...],
@@ -26,35 +60,7 @@ def on_speak(
 ) -> int:
     """Handle the speak command"""
     try:
-        # Parse provider shortcuts from text and options
-        provider_name = None
-        all_args = []
-
-        # Collect all arguments
-        if text:
-            all_args.append(text)
-        if options:
-            all_args.extend(options)
-
-        # Check if first argument is a provider shortcut
-        if all_args and all_args[0].startswith("@"):
-            provider_name, remaining_args = parse_provider_shortcuts(all_args)
-            # Handle invalid shortcuts
-            if provider_name and provider_name.startswith("@"):
-                shortcut = provider_name[1:]
-                exit_with_message(
-                    "\n".join(
-                        [
-                            f"Error: Unknown provider shortcut '@{shortcut}'",
-                            f"Available providers: {', '.join('@' + k for k in PROVIDER_SHORTCUTS.keys())}",
-                        ]
-                    ),
-                    exit_code=1,
-                )
-            all_args = remaining_args
-
-        # Parse any additional text from remaining arguments
-        all_text = all_args
+        provider_name, all_text = _split_provider_shortcut(text, options)
 
         if not all_text:
             # If no text provided, try to read from stdin
@@ -125,6 +131,50 @@ def on_speak(
         raise
 
 
+def _prepare_save(
+    text: Optional[str],
+    options: tuple[str, ...],
+    format: Optional[str],
+    debug: bool,
+    rate: Optional[str],
+    pitch: Optional[str],
+    ssml: bool,
+) -> tuple[Optional[str], str, Dict[str, Any]]:
+    """Resolve provider, final text and synthesis parameters for on_save and on_save_async.
+
+    Both handlers build their engine call from this, so whether a provider is awaited
+    natively or run in a worker never changes the audio produced.
+    """
+    provider_name, all_text = _split_provider_shortcut(text, options)
+
+    if not all_text:
+        exit_with_message("Error: No text provided to save", exit_code=2, show_usage=True)
+
+    final_text = " ".join(all_text)
+
+    # Convert to SSML if requested
+    if ssml:
+        generator = SSMLGenerator(SSMLPlatform.AZURE)  # Edge TTS uses Azure SSML
+        final_text = generator.convert_speech_markdown(final_text)
+        if debug:
+            print(f"Generated SSML:\n{final_text}", file=sys.stderr)
+
+    # Create output parameters
+    output_params: Dict[str, Any] = {
+        "stream": False,  # For saving, we don't stream
+        "debug": debug,
+    }
+
+    if rate:
+        output_params["rate"] = rate
+    if pitch:
+        output_params["pitch"] = pitch
+    if format:
+        output_params["format"] = format
+
+    return provider_name, final_text, output_params
+
+
 def on_save(
     text: Optional[str],
     options: tuple[str, ...],
@@ -140,47 +190,7 @@ def on_save(
 ) -> int:
     """Handle the save command"""
     try:
-        # Parse provider shortcuts from text and options
-        provider_name = None
-        all_args = []
-
-        # Collect all arguments
-        if text:
-            all_args.append(text)
-        if options:
-            all_args.extend(options)
-
-        # Check if first argument is a provider shortcut
-        if all_args and all_args[0].startswith("@"):
-            provider_name, remaining_args = parse_provider_shortcuts(all_args)
-            # Handle invalid shortcuts
-            if provider_name and provider_name.startswith("@"):
-                shortcut = provider_name[1:]
-                exit_with_message(
-                    "\n".join(
-                        [
-                            f"Error: Unknown provider shortcut '@{shortcut}'",
-                            f"Available providers: {', '.join('@' + k for k in PROVIDER_SHORTCUTS.keys())}",
-                        ]
-                    ),
-                    exit_code=1,
-                )
-            all_args = remaining_args
-
-        # Parse any additional text from remaining arguments
-        all_text = all_args
-
-        if not all_text:
-            exit_with_message("Error: No text provided to save", exit_code=2, show_usage=True)
-
-        final_text = " ".join(all_text)
-
-        # Convert to SSML if requested
-        if ssml:
-            generator = SSMLGenerator(SSMLPlatform.AZURE)  # Edge TTS uses Azure SSML
-            final_text = generator.convert_speech_markdown(final_text)
-            if debug:
-                print(f"Generated SSML:\n{final_text}", file=sys.stderr)
+        provider_name, final_text, output_params = _prepare_save(text, options, format, debug, rate, pitch, ssml)
 
         # Default output filename if not provided
         if not output:
@@ -189,19 +199,6 @@ def on_save(
         # Get TTS engine and synthesize
         engine = get_engine()
 
-        # Create output parameters
-        output_params: Dict[str, Any] = {
-            "stream": False,  # For saving, we don't stream
-            "debug": debug,
-        }
-
-        if rate:
-            output_params["rate"] = rate
-        if pitch:
-            output_params["pitch"] = pitch
-        if format:
-            output_params["format"] = format
-
         # Synthesize the text
         result = engine.synthesize_text(
             text=final_text, voice=voice, provider_name=provider_name, output_path=output, **output_params
@@ -216,3 +213,26 @@ def on_save(
     except Exception:
         # Re-raise to let CLI handle it with user-friendly messages
         raise
+
+
+async def on_save_async(
+    text: Optional[str],
+    options: tuple[str, ...],
+    output: str,
+    format: Optional[str],
+    voice: Optional[str],
+    debug: bool = False,
+    rate: Optional[str] = None,
+    pitch: Optional[str] = None,
+    ssml: bool = False,
+) -> int:
+    """Async counterpart of on_save for callers inside an event loop (e.g. the HTTP server).
+
+    Providers with native async support are awaited directly; others run in a worker thread.
+    """
+    provider_name, final_text, output_params = _prepare_save(text, options, format, debug, rate, pitch, ssml)
+
+    await get_engine().asynthesize_text(
+        text=final_text, voice=voice, provider_name=provider_name, output_path=output, **output_params
+    )
+    return 0
@@ -19,22 +19,11 @@ __all__ = [
 
 def parse_provider_shortcuts(args: list) -> tuple[Optional[str], list]:
     """Parse @provider shortcuts from arguments"""
-    if not args:
+    if not args or not (first_arg := args[0]).startswith("@"):
         return None, args
 
-    # Check if first argument is a provider shortcut
-    first_arg = args[0]
-    if first_arg.startswith("@"):
-        shortcut = first_arg[1:]  # Remove @
-        if shortcut in PROVIDER_SHORTCUTS:
-            provider_name = PROVIDER_SHORTCUTS[shortcut]
-            remaining_args = args[1:]  # Rest of the arguments
-            return provider_name, remaining_args
-        else:
-            # Invalid shortcut - let calling function handle the error
-            return first_arg, args[1:]
-
-    return None, args
+    # Unknown shortcuts are returned as-is - let calling function handle the error
+    return PROVIDER_SHORTCUTS.get(first_arg[1:], first_arg), args[1:]
 
 
 def handle_provider_shortcuts(provider_arg: Optional[str]) -> Optional[str]:
@@ -43,12 +32,8 @@ def handle_provider_shortcuts(provider_arg: Optional[str]) -> Optional[str]:
         return None
 
     if provider_arg.startswith("@"):
-        shortcut = provider_arg[1:]  # Remove @
-        if shortcut in PROVIDER_SHORTCUTS:
-            return PROVIDER_SHORTCUTS[shortcut]
-        else:
-            # Return the original for error handling
-            return provider_arg
+        # Return the original for error handling if the shortcut is unknown
+        return PROVIDER_SHORTCUTS.get(provider_arg[1:], provider_arg)
 
     return provider_arg
 
@@ -22,12 +22,17 @@ Usage:
     set_language("es")
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
+# How many parent directories to probe for a shared i18n/ checkout
+_MAX_PARENT_DEPTH = 6
 
+
+@functools.cache
 def _find_i18n_root() -> Path | None:
     env_path = os.environ.get("MATILDA_I18N_PATH")
     if env_path:
@@ -36,13 +41,27 @@ def _find_i18n_root() -> Path | None:
             return candidate
 
     for base in [Path(__file__).resolve(), Path.cwd()]:
-        for parent in [base, *base.parents]:
+        for parent in [base, *base.parents[:_MAX_PARENT_DEPTH]]:
             candidate = parent / "i18n"
             if candidate.exists():
                 return candidate
     return None
 
 
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """Yield (dotted.key, message) pairs for every string leaf in a locale tree."""
+    for name, value in data.items():
+        path = f"{prefix}{name}"
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{path}.")
+        elif isinstance(value, str):
+            yield sys.intern(path), value
+
+
+# Optional pre-flattened {lang: {domain: {key: message}}} bundle written by
+# ``python -m matilda_voice.i18n.compile``; when present it replaces per-file JSON loads.
+COMPILED_BUNDLE_NAME = "compiled.json"
+
 # Add central i18n to path for base_loader import
 _I18N_PATH = _find_i18n_root()
 if _I18N_PATH and str(_I18N_PATH) not in sys.path:
@@ -59,6 +78,13 @@ except ImportError:
     import os
     import threading
 
+    try:
+        import orjson
+
+        _json_loads: Callable[[bytes], Any] = orjson.loads
+    except ImportError:
+        _json_loads = json.loads
+
     def get_monorepo_locales_path() -> Path:
         i18n_root = _find_i18n_root()
         if i18n_root:
@@ -76,42 +102,64 @@ except ImportError:
         ) -> None:
             self.locales_path = locales_path or get_monorepo_locales_path()
             self.default_domain = default_domain
-            self._cache: Dict[str, dict] = {}
+            self._cache: Dict[str, Dict[str, str]] = {}
             self._lock = threading.Lock()
             self._lang = default_language
+            self._bundle = self._load_bundle()
+
+        def _load_bundle(self) -> Dict[str, Dict[str, Dict[str, str]]]:
+            try:
+                bundle = _json_loads((self.locales_path / COMPILED_BUNDLE_NAME).read_bytes())
+            except (OSError, ValueError):
+                return {}
+            return bundle if isinstance(bundle, dict) else {}
 
         def set_language(self, lang: str) -> None:
             self._lang = lang
-            self._cache.clear()
+            # Rebind rather than clear() so lock-free readers never observe a half-emptied dict
+            self._cache = {}
 
         def get_language(self) -> str:
             return str(os.environ.get("MATILDA_LANG", self._lang))[:2]
 
-        def _load_domain(self, domain: str, lang: Optional[str] = None) -> dict[str, Any]:
+        def _load_domain(self, domain: str, lang: Optional[str] = None) -> Dict[str, str]:
             lang = lang or self.get_language()
             key = f"{lang}:{domain}"
+            # Fast path: cache hits skip the lock (dict reads are atomic under the GIL)
+            hit = self._cache.get(key)
+            if hit is not None:
+                return hit
             with self._lock:
-                if key not in self._cache:
+                hit = self._cache.get(key)
+                if hit is None:
+                    hit = {}
                     for try_lang in [lang, "en"]:
+                        bundled = self._bundle.get(try_lang, {}).get(domain)
+                        if bundled is not None:
+                            hit = bundled
+                            break
                         path = self.locales_path / try_lang / f"{domain}.json"
                         if path.exists():
-                            self._cache[key] = json.loads(path.read_text(encoding="utf-8"))
+                            hit = dict(_flatten(_json_loads(path.read_bytes())))
                             break
-                    else:
-                        self._cache[key] = {}
-                return self._cache.get(key, {})
+                    self._cache[key] = hit
+                return hit
 
         def t(self, key: str, domain: Optional[str] = None, **kw: Any) -> str:
             domain = domain or self.default_domain
-            val: Any = self._load_domain(domain)
-            for part in key.split("."):
-                val = val.get(part, {}) if isinstance(val, dict) else {}
-            if not isinstance(val, str):
+            val = self._load_domain(domain).get(key)
+            if val is None:
                 return self.t(key, "common", **kw) if domain != "common" else key
             return val.format(**kw) if kw else val
 
-        def t_domain(self, domain: str) -> Callable[[str], str]:
-            return lambda key, **kw: self.t(key, domain, **kw)
+        def t_domain(self, domain: str) -> Callable[..., str]:
+            t = self.t
+
+            def _t(key: str, **kw: Any) -> str:
+                # Skip re-packing kwargs for the common no-interpolation call
+                return t(key, domain, **kw) if kw else t(key, domain)
+
+            return _t
 
     I18nLoader = FallbackI18nLoader
 
@@ -120,18 +168,36 @@ except ImportError:
 # Voice-specific loader instance
 # =============================================================================
 
-_loader = I18nLoader(default_domain="voice")
-
-# Primary translation function (defaults to voice domain)
-t = _loader.t
-
-# Domain-specific shortcuts
-t_voice = _loader.t_domain("voice")
-t_common = _loader.t_domain("common")
+# Built on first use of any exported helper so importing this module does not
+# resolve the locales path or touch the filesystem.
+_loader: Any = None
+_LAZY_EXPORTS = frozenset({"t", "t_voice", "t_common", "set_language", "get_language"})
+
+
+def _ensure_loader() -> None:
+    global _loader
+    if _loader is not None:
+        return
+    _loader = I18nLoader(default_domain="voice")
+    # Cache the bound helpers as real module globals so later lookups skip __getattr__
+    globals().update(
+        # Primary translation function (defaults to voice domain)
+        t=_loader.t,
+        # Domain-specific shortcuts
+        t_voice=_loader.t_domain("voice"),
+        t_common=_loader.t_domain("common"),
+        # Language management
+        set_language=_loader.set_language,
+        get_language=_loader.get_language,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        _ensure_loader()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Language management
-set_language = _loader.set_language
-get_language = _loader.get_language
 
 # Re-export for convenience
 __all__ = [
@@ -0,0 +1,50 @@
+"""
+Bundle locale JSON files into a single pre-flattened file.
+
+Locale files rarely change between releases, so builds can collapse every
+``<lang>/<domain>.json`` into one ``compiled.json`` that the loader reads once
+instead of opening and parsing each domain on first use.
+
+Usage:
+    python -m matilda_voice.i18n.compile [LOCALES_DIR]
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import COMPILED_BUNDLE_NAME, _flatten, get_monorepo_locales_path
+
+
+def compile_locales(locales_path: Path) -> Dict[str, Dict[str, Dict[str, str]]]:
+    """Load and flatten every ``<lang>/<domain>.json`` under locales_path."""
+    bundle: Dict[str, Dict[str, Dict[str, str]]] = {}
+    for domain_file in sorted(locales_path.glob("*/*.json")):
+        lang = domain_file.parent.name
+        data = json.loads(domain_file.read_bytes())
+        bundle.setdefault(lang, {})[domain_file.stem] = dict(_flatten(data))
+    return bundle
+
+
+def write_bundle(locales_path: Path) -> Path:
+    """Compile locales_path and write the bundle next to the source files."""
+    output_path = locales_path / COMPILED_BUNDLE_NAME
+    bundle = compile_locales(locales_path)
+    output_path.write_text(json.dumps(bundle, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    return output_path
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    locales_path = Path(args[0]) if args else get_monorepo_locales_path()
+    if not locales_path.is_dir():
+        print(f"Locales directory not found: {locales_path}", file=sys.stderr)
+        return 1
+    output_path = write_bundle(locales_path)
+    print(f"Wrote {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,7 +9,7 @@ import tempfile
 import threading
 import time
 import wave
-from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ..exceptions import AudioPlaybackError, DependencyError
 from .config import get_config_value
@@ -848,6 +848,50 @@ def convert_audio(input_path: str, output_path: str, output_format: str) -> None
         raise ProviderError(f"Audio conversion failed: {e}") from e
 
 
+def convert_audio_stream(chunks: Iterable[bytes], output_path: str, input_format: str) -> None:
+    """Convert streamed audio by piping it into ffmpeg's stdin, without a temporary file.
+
+    Args:
+        chunks: Encoded audio data in ``input_format``
+        output_path: Path for output audio file (format is taken from its extension)
+        input_format: ffmpeg demuxer name for the input (e.g. "mp3", "wav")
+
+    Raises:
+        DependencyError: If ffmpeg is not found
+        ProviderError: If conversion fails
+    """
+    from ..exceptions import ProviderError
+
+    try:
+        process = subprocess.Popen(
+            ["ffmpeg", "-f", input_format, "-i", "pipe:0", "-y", output_path],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except FileNotFoundError as e:
+        raise DependencyError("ffmpeg not found. Please install ffmpeg for format conversion.") from e
+
+    stdin = process.stdin
+    assert stdin is not None
+    try:
+        for chunk in chunks:
+            stdin.write(chunk)
+    except BrokenPipeError:
+        # ffmpeg exited early; its return code below reports the failure
+        pass
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        with contextlib.suppress(BrokenPipeError):
+            stdin.close()
+
+    returncode = process.wait()
+    if returncode != 0:
+        raise ProviderError(f"Audio conversion failed: ffmpeg exited with status {returncode}")
+
+
 def convert_with_cleanup(input_path: str, output_path: str, output_format: str) -> None:
     """Convert audio file with automatic cleanup of input file.
 
@@ -10,11 +10,15 @@ Usage:
     port = get_config_value('chatterbox_server_port')  # Returns 12345 or env override
 """
 
+import copy
+import functools
 import logging
 import os
+import re
 import tomllib
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 import toml
 
@@ -25,7 +29,7 @@ CONFIG_DEFAULTS = {
     # Network & Communication
     "chatterbox_server_port": 12345,
     "socket_recv_buffer_size": 4096,
-    "http_streaming_chunk_size": 1024,
+    "http_streaming_chunk_size": 4096,  # one page; larger sizes delay first audio (httpx re-chunks)
     # Timeouts (seconds)
     "server_startup_timeout": 30,
     "server_poll_interval": 1,
@@ -97,6 +101,7 @@ CONFIG_DEFAULTS = {
     "cache_recent_access_window_seconds": 3600,  # 1 hour
     # Provider-specific Limits
     "google_service_account_json_min_length": 100,
+    "azure_max_concurrent_requests": 8,
     # Voice Defaults
     "default_provider": "edge_tts",
     "default_voice": "en-US-EmmaMultilingualNeural",
@@ -105,6 +110,9 @@ CONFIG_DEFAULTS = {
     "default_output_format": "mp3",
 }
 
+# Expected value type per key, used to coerce TTS_<KEY> environment overrides
+_DEFAULT_TYPES = {key: type(value) for key, value in CONFIG_DEFAULTS.items()}
+
 # Default configuration for voice settings (minimal)
 DEFAULT_CONFIG = {
     "version": "1.0",
@@ -130,16 +138,21 @@ DEFAULT_CONFIG = {
     },
 }
 
-_config_cache = None
+# Resolved configuration, exposed read-only as a mapping and as an attribute
+# namespace so hot paths can use a plain attribute read instead of a dict lookup.
+_config_cache: Optional[Mapping[str, Any]] = None
+_config_namespace: Optional[SimpleNamespace] = None
 
 
-def load_toml_config() -> Dict[str, Any]:
+def load_toml_config() -> Mapping[str, Any]:
     """Load configuration from TOML file and environment variables."""
-    global _config_cache
+    global _config_cache, _config_namespace
     if _config_cache is not None:
         return _config_cache
 
-    config = CONFIG_DEFAULTS.copy()
+    # Collect overrides separately so the common no-override case can share
+    # CONFIG_DEFAULTS (read-only) instead of copying it.
+    overrides: Dict[str, Any] = {}
 
     config_file = get_config_path()
     if config_file.exists():
@@ -155,69 +168,125 @@ def load_toml_config() -> Dict[str, Any]:
                 if isinstance(values, dict):
                     for key, value in values.items():
                         flat_key = f"{section}_{key}"
-                        if flat_key in config:
-                            config[flat_key] = value
+                        if flat_key in CONFIG_DEFAULTS:
+                            overrides[flat_key] = value
                 else:
-                    if section in config:
-                        config[section] = values
+                    if section in CONFIG_DEFAULTS:
+                        overrides[section] = values
 
             logger.debug(f"Loaded TOML config from {config_file}")
         except Exception:
             logger.exception(f"Failed to load TOML config from {config_file}")
 
     # Environment variable overrides (highest precedence)
-    for key in config:
-        env_value = os.environ.get(f"TTS_{key.upper()}")
-        if env_value is not None:
-            config[key] = _parse_env_value(env_value, type(config[key]))
-            logger.debug(f"Override from env: {key} = {config[key]}")
+    for name, env_value in os.environ.items():
+        if not name.startswith("TTS_"):
+            continue
+        key = name[4:].lower()
+        expected_type = _DEFAULT_TYPES.get(key)
+        if expected_type is not None:
+            overrides[key] = _parse_env_value(env_value, expected_type)
+            logger.debug(f"Override from env: {key} = {overrides[key]}")
+
+    config = {**CONFIG_DEFAULTS, **overrides} if overrides else CONFIG_DEFAULTS
+    _config_cache = MappingProxyType(config)
+    _config_namespace = SimpleNamespace(**config)
+    return _config_cache
 
-    _config_cache = config
-    return config
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in ("true", "1", "yes", "on")
+
+
+def _parse_int(value: str) -> Any:
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _parse_float(value: str) -> Any:
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _parse_list(value: str) -> List[Any]:
+    # Simple list parsing for things like http_payment_errors
+    items = value.split(",")
+    try:
+        return [int(item) for item in items]
+    except ValueError:
+        return items
+
+
+# Environment value parsers keyed by the expected config type
+_ENV_VALUE_PARSERS: Dict[type, Callable[[str], Any]] = {
+    bool: _parse_bool,
+    int: _parse_int,
+    float: _parse_float,
+    list: _parse_list,
+}
 
 
 def _parse_env_value(value: str, expected_type: type) -> Any:
     """Parse environment variable value to appropriate type."""
-    if expected_type is bool:
-        return value.lower() in ("true", "1", "yes", "on")
-    elif expected_type is int:
-        try:
-            return int(value)
-        except ValueError:
-            return value
-    elif expected_type is float:
-        try:
-            return float(value)
-        except ValueError:
-            return value
-    elif expected_type is list:
-        # Simple list parsing for things like http_payment_errors
-        try:
-            return [int(x.strip()) for x in value.split(",")]
-        except ValueError:
-            return value.split(",")
-    return value
+    parser = _ENV_VALUE_PARSERS.get(expected_type)
+    return parser(value) if parser is not None else value
+
+
+def _get_config_namespace() -> SimpleNamespace:
+    """Return the resolved configuration as an attribute namespace."""
+    if _config_namespace is None:
+        load_toml_config()
+    assert _config_namespace is not None
+    return _config_namespace
 
 
 def get_config_value(key: str, default: Any = None) -> Any:
     """Get a configuration value. Simple function - no classes needed."""
-    config = load_toml_config()
-    return config.get(key, default)
+    return getattr(_get_config_namespace(), key, default)
+
+
+# Bumped whenever configuration is reloaded or saved so derived caches can key on it
+_config_epoch = 0
+
+
+def get_config_epoch() -> int:
+    """Return a counter that changes every time configuration is reloaded or saved."""
+    return _config_epoch
 
 
 def reload_config() -> None:
     """Reload configuration from files (useful for testing)."""
-    global _config_cache
+    global _config_cache, _config_namespace, _config_path_cache, _loaded_config_cache, _full_toml_cache
+    global _config_epoch
+    _config_epoch += 1
     _config_cache = None
+    _config_namespace = None
+    _config_path_cache = None
+    _loaded_config_cache = None
+    _full_toml_cache = None
 
 
 # Configuration file management
+# Resolved config path, keyed by the MATILDA_CONFIG and home directory values it was derived from
+_config_path_cache: Optional[Tuple[Tuple[Optional[str], ...], Path]] = None
+
+
 def get_config_path() -> Path:
     """Get the configuration file path, using XDG standard with fallback."""
+    global _config_path_cache
     env_path = os.environ.get("MATILDA_CONFIG")
-    if env_path:
-        return Path(env_path)
-    return Path.home() / ".matilda" / "config.toml"
+    # Path.home() reads HOME (USERPROFILE on Windows), so those are part of the key too
+    cache_key = (env_path, os.environ.get("HOME"), os.environ.get("USERPROFILE"))
+    if _config_path_cache is not None and _config_path_cache[0] == cache_key:
+        return _config_path_cache[1]
+
+    path = Path(env_path) if env_path else Path.home() / ".matilda" / "config.toml"
+    _config_path_cache = (cache_key, path)
+    return path
 
 
 def get_default_config() -> Dict[str, Any]:
@@ -226,53 +295,103 @@ def get_default_config() -> Dict[str, Any]:
 
 
 def _merge_dicts(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    merged = base.copy()
+    # Only the top level and sub-dicts that are actually overridden get copied;
+    # untouched nested sections are shared with base.
+    if not override:
+        return base
+    merged = dict(base)
     for key, value in override.items():
-        if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-            merged[key] = _merge_dicts(merged[key], value)
+        base_value = merged.get(key)
+        if isinstance(base_value, dict) and isinstance(value, dict):
+            merged[key] = _merge_dicts(base_value, value)
         else:
             merged[key] = value
     return merged
 
 
+# Last load_config() result and last full TOML document read or written,
+# each keyed by the path, mtime and size of the file it corresponds to
+_loaded_config_cache: Optional[Tuple[Path, int, int, Dict[str, Any]]] = None
+_full_toml_cache: Optional[Tuple[Path, int, int, Dict[str, Any]]] = None
+
+
 def load_config() -> Dict[str, Any]:
-    """Load TOML configuration from file."""
+    """Load TOML configuration from file.
+
+    The parsed file is cached until its mtime or size changes; callers always
+    receive their own deep copy and may modify it, nested tables included, freely.
+    """
+    global _loaded_config_cache, _full_toml_cache
     config_path = get_config_path()
-    config = get_default_config()
 
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except OSError:
         logger.debug(f"Config file not found at {config_path}, using defaults")
-        return config
+        return copy.deepcopy(DEFAULT_CONFIG)
+
+    cached = _loaded_config_cache
+    if cached is not None and cached[:3] == (config_path, stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[3])
 
     try:
         with open(config_path, "rb") as f:
             full_config = tomllib.load(f)
         file_config = full_config.get("voice", {})
-        return _merge_dicts(config, file_config)
+        # _merge_dicts never mutates DEFAULT_CONFIG, and merged is only handed out as a deep copy
+        merged = _merge_dicts(DEFAULT_CONFIG, file_config)
     except Exception as e:
         logger.warning(f"Failed to load config from {config_path}: {e}. Using defaults.")
-        return config
+        return copy.deepcopy(DEFAULT_CONFIG)
+
+    _loaded_config_cache = (config_path, stat.st_mtime_ns, stat.st_size, merged)
+    _full_toml_cache = (config_path, stat.st_mtime_ns, stat.st_size, full_config)
+    return copy.deepcopy(merged)
+
+
+def _read_full_toml(config_path: Path) -> Dict[str, Any]:
+    """Read the whole TOML document, reusing the last parse if the file is unchanged."""
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        return {}
+
+    cached = _full_toml_cache
+    if cached is not None and cached[:3] == (config_path, stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[3])
+
+    with open(config_path, "rb") as f:
+        return tomllib.load(f)
 
 
 def save_config(config: Dict[str, Any]) -> bool:
     """Save configuration to file atomically."""
+    global _loaded_config_cache, _full_toml_cache, _config_epoch
     config_path = get_config_path()
+    _loaded_config_cache = None
+    _config_epoch += 1
 
     try:
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if config_path.exists():
-            with open(config_path, "rb") as f:
-                full_config = tomllib.load(f)
-        else:
-            full_config = {}
-
+        # Other matilda tools own the remaining sections, so they are carried over as-is
+        full_config = _read_full_toml(config_path)
         full_config["voice"] = config
+        data = toml.dumps(full_config).encode("utf-8")
         temp_path = config_path.with_suffix(".tmp")
-        with open(temp_path, "w", encoding="utf-8") as f:
-            f.write(toml.dumps(full_config))
-
-        temp_path.replace(config_path)
+        # Config may hold API keys: owner-only permissions, flushed to disk before the rename
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        os.replace(temp_path, config_path)
+        stat = config_path.stat()
+        _full_toml_cache = (config_path, stat.st_mtime_ns, stat.st_size, full_config)
         logger.info(f"Configuration saved to {config_path}")
         return True
 
@@ -281,6 +400,31 @@ def save_config(config: Dict[str, Any]) -> bool:
         return False
 
 
+# Voice auto-detection vocabulary
+_AUDIO_SUFFIXES = ("wav", "mp3", "flac", "ogg", "m4a")
+_OPENAI_VOICES = ("alloy", "echo", "fable", "nova", "onyx", "shimmer")
+_ELEVENLABS_VOICES = ("rachel", "domi", "bella", "antoni", "elli", "josh", "arnold", "adam", "sam")
+_GOOGLE_LANG_PREFIXES = ("en", "es", "fr", "de", "it", "pt", "ja", "ko", "zh")
+_EDGE_LANG_PREFIXES = ("en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh")
+
+# Voice auto-detection patterns, tried in order; the first alternative that
+# matches the whole string names the provider via ``lastgroup``.
+_VOICE_PATTERN = re.compile(
+    # File path - likely chatterbox voice cloning
+    rf"(?P<chatterbox>.*/.*|.*\.(?:{'|'.join(_AUDIO_SUFFIXES)}))"
+    # OpenAI voice names
+    rf"|(?P<openai>{'|'.join(_OPENAI_VOICES)})"
+    # Google Cloud TTS format like "en-US-Neural2-A" or "en-US-Wavenet-A"
+    rf"|(?P<google>(?:{'|'.join(_GOOGLE_LANG_PREFIXES)})-.*(?:Neural2|Wavenet).*)"
+    # ElevenLabs default voice names
+    rf"|(?P<elevenlabs>{'|'.join(_ELEVENLABS_VOICES)})"
+    # Standard Azure/Edge TTS format like "en-US-JennyNeural" (language-region-voice pattern)
+    rf"|(?P<edge_tts>.*Neural.*|(?:{'|'.join(_EDGE_LANG_PREFIXES)})-.*-.*)",
+    re.DOTALL,
+)
+
+
+@functools.lru_cache(maxsize=512)
 def parse_voice_setting(voice_str: str) -> Tuple[Optional[str], str]:
     """Parse voice setting, returning (provider, voice) tuple.
 
@@ -292,36 +436,15 @@ def parse_voice_setting(voice_str: str) -> Tuple[Optional[str], str]:
     Returns:
         (provider, voice) tuple. Provider may be None for auto-detection.
     """
-    if ":" in voice_str:
+    provider, sep, voice = voice_str.partition(":")
+    if sep:
         # Explicit provider format: "openai:nova", "google:en-US-Neural2-A", etc.
-        provider, voice = voice_str.split(":", 1)
         return provider, voice
-    else:
-        # Auto-detect provider based on voice characteristics
-        if "/" in voice_str or voice_str.endswith((".wav", ".mp3", ".flac", ".ogg", ".m4a")):
-            # File path - likely chatterbox voice cloning
-            return "chatterbox", voice_str
-        elif voice_str in ["alloy", "echo", "fable", "nova", "onyx", "shimmer"]:
-            # OpenAI voice names
-            return "openai", voice_str
-        elif voice_str.startswith(("en-", "es-", "fr-", "de-", "it-", "pt-", "ja-", "ko-", "zh-")) and (
-            "Neural2" in voice_str or "Wavenet" in voice_str
-        ):
-            # Google Cloud TTS format like "en-US-Neural2-A" or "en-US-Wavenet-A"
-            return "google", voice_str
-        elif voice_str in ["rachel", "domi", "bella", "antoni", "elli", "josh", "arnold", "adam", "sam"]:
-            # ElevenLabs default voice names
-            return "elevenlabs", voice_str
-        elif "Neural" in voice_str or (
-            len(voice_str.split("-")) >= 3
-            and voice_str.startswith(("en-", "es-", "fr-", "de-", "it-", "pt-", "ru-", "ja-", "ko-", "zh-"))
-        ):
-            # Standard Azure/Edge TTS format like "en-US-JennyNeural"
-            # (language-region-voice pattern)
-            return "edge_tts", voice_str
-        else:
-            # Unknown format, let current provider handle it
-            return None, voice_str
+
+    # Auto-detect provider based on voice characteristics.
+    # Unknown formats return None and let the current provider handle them.
+    match = _VOICE_PATTERN.fullmatch(voice_str)
+    return (match.lastgroup if match else None), voice_str
 
 
 def validate_config(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -358,6 +481,10 @@ def set_setting(key: str, value: Any) -> bool:
     return save_config(validated_config)
 
 
+# Legacy ElevenLabs keys are plain hex strings
+_HEX_KEY_PATTERN = re.compile(r"[0-9a-fA-F]+")
+
+
 def validate_api_key(provider: str, api_key: str) -> bool:
     """Validate API key format for different providers."""
     if not api_key or not isinstance(api_key, str) or not provider or not isinstance(provider, str):
@@ -385,7 +512,7 @@ def validate_api_key(provider: str, api_key: str) -> bool:
         if api_key.startswith("sk_"):
             return len(api_key) >= 32
         elevenlabs_key_length = int(get_config_value("elevenlabs_api_key_length", 32))
-        return len(api_key) == elevenlabs_key_length and all(c in "0123456789abcdef" for c in api_key.lower())
+        return len(api_key) == elevenlabs_key_length and _HEX_KEY_PATTERN.fullmatch(api_key) is not None
 
     else:
         # Unknown provider, return False for security
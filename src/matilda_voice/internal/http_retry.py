@@ -7,12 +7,13 @@ This module provides retry logic for HTTP requests to external APIs:
 - Safe defaults to avoid duplicate charges on non-idempotent endpoints
 """
 
+import asyncio
 import contextlib
 import logging
 import random
 import threading
 import time
-from typing import Any, Callable, Iterable, Iterator, Optional, Set, Tuple, Type
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Set, Tuple, Type
 
 import httpx
 
@@ -110,6 +111,7 @@ def request_with_retry(
     backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
     idempotent: bool = True,
     provider_name: str = "API",
+    client: Optional[httpx.Client] = None,
     **kwargs: Any,
 ) -> httpx.Response:
     """Make an HTTP request with retry logic.
@@ -127,6 +129,8 @@ def request_with_retry(
         idempotent: If False, only retry on connection errors, not HTTP errors.
                    This prevents duplicate charges on non-idempotent endpoints.
         provider_name: Name of the provider for logging
+        client: Optional pooled client; reusing one keeps TCP/TLS connections alive
+                between calls. Defaults to a one-off httpx.request.
         **kwargs: Additional arguments passed to httpx.request
 
     Returns:
@@ -150,12 +154,14 @@ def request_with_retry(
     last_response: Optional[httpx.Response] = None
     breaker = get_circuit_breaker(provider_name)
 
+    send = client.request if client is not None else httpx.request
+
     effective_retries = 1 if not idempotent else max_retries
     for attempt in range(effective_retries + 1):
         if not breaker.allow_request():
             raise ProviderError(f"{provider_name} circuit breaker is open; request blocked")
         try:
-            response = httpx.request(method, url, **kwargs)
+            response = send(method, url, **kwargs)
 
             # Check if we should retry based on status code
             retry, reason = should_retry(response.status_code)
@@ -226,6 +232,14 @@ def request_with_retry(
     raise NetworkError(f"{provider_name} request failed after {max_retries + 1} attempts")
 
 
+def _stream_interrupted(provider_name: str, breaker: "CircuitBreaker", error: httpx.RequestError) -> NetworkError:
+    """Record a failure that happened while the caller was reading a streamed body."""
+    # Re-sending here could duplicate a billed, non-idempotent request
+    breaker.record_failure()
+    logger.error(f"[{provider_name}] Stream interrupted while reading the response: {error}")
+    return NetworkError(f"{provider_name} stream interrupted: {error}")
+
+
 @contextlib.contextmanager
 def stream_with_retry(
     method: str,
@@ -236,22 +250,31 @@ def stream_with_retry(
     backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
     idempotent: bool = True,
     provider_name: str = "API",
+    client: Optional[httpx.Client] = None,
     **kwargs: Any,
 ) -> Iterator[httpx.Response]:
-    """Context manager for streaming HTTP requests with retry logic."""
+    """Context manager for streaming HTTP requests with retry logic.
+
+    Only opening the stream is retried. Once the response has been handed to the
+    caller, a timeout or network error while reading the body is raised as a
+    NetworkError instead of re-sending the request.
+    """
     last_exception: Optional[BaseException] = None
     breaker = get_circuit_breaker(provider_name)
+    open_stream = client.stream if client is not None else httpx.stream
+    yielded = False
 
     for attempt in range(max_retries + 1):
         if not breaker.allow_request():
             raise ProviderError(f"{provider_name} circuit breaker is open; request blocked")
         try:
-            with httpx.stream(method, url, **kwargs) as response:
+            with open_stream(method, url, **kwargs) as response:
                 retry, reason = should_retry(response.status_code)
 
                 if not retry:
                     if 200 <= response.status_code < 300:
                         breaker.record_success()
+                    yielded = True
                     yield response
                     return
 
@@ -259,6 +282,7 @@ def stream_with_retry(
                     logger.warning(
                         f"[{provider_name}] HTTP {response.status_code} on non-idempotent stream, not retrying"
                     )
+                    yielded = True
                     yield response
                     return
 
@@ -276,6 +300,8 @@ def stream_with_retry(
                 raise NetworkError(f"{provider_name} stream failed after {max_retries + 1} attempts")
 
         except httpx.TimeoutException as e:
+            if yielded:
+                raise _stream_interrupted(provider_name, breaker, e) from e
             last_exception = e
             breaker.record_failure()
             if attempt < max_retries:
@@ -289,6 +315,8 @@ def stream_with_retry(
                 logger.error(f"[{provider_name}] Stream timeout. All {max_retries + 1} attempts exhausted.")
 
         except httpx.RequestError as e:
+            if yielded:
+                raise _stream_interrupted(provider_name, breaker, e) from e
             last_exception = e
             breaker.record_failure()
             if attempt < max_retries:
@@ -309,6 +337,86 @@ def stream_with_retry(
     raise NetworkError(f"{provider_name} stream failed after {max_retries + 1} attempts")
 
 
+@contextlib.asynccontextmanager
+async def astream_with_retry(
+    method: str,
+    url: str,
+    client: httpx.AsyncClient,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    base_delay: float = DEFAULT_BASE_DELAY,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    idempotent: bool = True,
+    provider_name: str = "API",
+    **kwargs: Any,
+) -> AsyncIterator[httpx.Response]:
+    """Async counterpart of :func:`stream_with_retry` for a pooled AsyncClient.
+
+    Backoff sleeps with asyncio.sleep so the event loop keeps serving other requests.
+    As with the sync version, only opening the stream is retried.
+    """
+    last_exception: Optional[BaseException] = None
+    breaker = get_circuit_breaker(provider_name)
+    yielded = False
+
+    for attempt in range(max_retries + 1):
+        if not breaker.allow_request():
+            raise ProviderError(f"{provider_name} circuit breaker is open; request blocked")
+        try:
+            async with client.stream(method, url, **kwargs) as response:
+                retry, reason = should_retry(response.status_code)
+
+                if not retry:
+                    if 200 <= response.status_code < 300:
+                        breaker.record_success()
+                    yielded = True
+                    yield response
+                    return
+
+                if not idempotent and response.status_code not in {429}:
+                    logger.warning(
+                        f"[{provider_name}] HTTP {response.status_code} on non-idempotent stream, not retrying"
+                    )
+                    yielded = True
+                    yield response
+                    return
+
+                breaker.record_failure()
+                if attempt < max_retries:
+                    delay = calculate_backoff(attempt, base_delay, max_delay, backoff_factor)
+                    logger.warning(
+                        f"[{provider_name}] {reason}. Attempt {attempt + 1}/{max_retries + 1}. "
+                        f"Retrying in {delay:.1f}s..."
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                logger.error(f"[{provider_name}] {reason}. All {max_retries + 1} attempts exhausted.")
+                raise NetworkError(f"{provider_name} stream failed after {max_retries + 1} attempts")
+
+        except httpx.RequestError as e:
+            if yielded:
+                raise _stream_interrupted(provider_name, breaker, e) from e
+            last_exception = e
+            breaker.record_failure()
+            if attempt < max_retries:
+                delay = calculate_backoff(attempt, base_delay, max_delay, backoff_factor)
+                logger.warning(
+                    f"[{provider_name}] Stream error: {e}. Attempt {attempt + 1}/{max_retries + 1}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+            else:
+                logger.error(f"[{provider_name}] Stream error: {e}. All {max_retries + 1} attempts exhausted.")
+
+    if last_exception:
+        raise NetworkError(
+            f"{provider_name} stream failed after {max_retries + 1} attempts: {last_exception}"
+        ) from last_exception
+
+    raise NetworkError(f"{provider_name} stream failed after {max_retries + 1} attempts")
+
+
 def call_with_retry(
     func: Callable[[], Any],
     max_retries: int = DEFAULT_MAX_RETRIES,
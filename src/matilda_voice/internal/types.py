@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Mapping, Optional, TypedDict
 
 # =============================================================================
 # Semantic Types (for document processing and speech synthesis)
@@ -64,7 +64,7 @@ class ProviderInfo(TypedDict, total=False):
     api_status: Optional[str]
     voices: Optional[List[Dict[str, Any]]]
     all_voices: Optional[List[str]]
-    voice_descriptions: Optional[Dict[str, str]]
+    voice_descriptions: Optional[Mapping[str, str]]
     features: Optional[Dict[str, Any]]
     pricing: Optional[str]
     output_format: Optional[str]
@@ -8,11 +8,12 @@ from ..internal.audio_utils import convert_with_cleanup, parse_bool_param
 from ..internal.types import ProviderInfo
 from ..voice_manager import VoiceManager
 
+logger = logging.getLogger(__name__)
+
 
 class ChatterboxProvider(TTSProvider):
     def __init__(self) -> None:
         self.tts = None
-        self.logger = logging.getLogger(__name__)
 
     def _lazy_load(self) -> None:
         if self.tts is None:
@@ -40,11 +41,11 @@ class ChatterboxProvider(TTSProvider):
             return bool(torch.cuda.is_available())
         except ImportError:
             # PyTorch not installed
-            self.logger.debug("PyTorch not available, using CPU")
+            logger.debug("PyTorch not available, using CPU")
             return False
         except (RuntimeError, AttributeError) as e:
             # Unexpected error checking CUDA
-            self.logger.warning(f"Error checking CUDA availability: {e}")
+            logger.warning(f"Error checking CUDA availability: {e}")
             return False
 
     def synthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
@@ -83,7 +84,7 @@ class ChatterboxProvider(TTSProvider):
                     return
 
                 except (ConnectionError, OSError, ValueError) as e:
-                    self.logger.warning(f"Server synthesis failed, falling back to direct: {e}")
+                    logger.warning(f"Server synthesis failed, falling back to direct: {e}")
                     # Fall through to direct synthesis
 
         # Fallback to direct synthesis (legacy behavior)
@@ -143,7 +144,7 @@ class ChatterboxProvider(TTSProvider):
         from ..internal.audio_utils import StreamingPlayer
 
         try:
-            self.logger.debug("Converting audio tensor for streaming")
+            logger.debug("Converting audio tensor for streaming")
             # Convert tensor to numpy and ensure it's on CPU
             audio_data = wav_tensor.cpu().numpy().squeeze()
 
@@ -164,10 +165,10 @@ class ChatterboxProvider(TTSProvider):
             # Create a generator that yields the buffer content as a single chunk
             player.play_chunks(iter([buffer.getvalue()]))
 
-            self.logger.debug("Audio streaming completed")
+            logger.debug("Audio streaming completed")
 
         except (ValueError, RuntimeError, MemoryError) as e:
-            self.logger.error(f"Unexpected audio streaming error: {type(e).__name__}: {e}")
+            logger.error(f"Unexpected audio streaming error: {type(e).__name__}: {e}")
             raise AudioPlaybackError(f"Audio streaming failed unexpectedly: {type(e).__name__}: {e}") from e
 
     def _stream_audio_data(self, audio_data: bytes) -> None:
@@ -175,16 +176,16 @@ class ChatterboxProvider(TTSProvider):
         from ..internal.audio_utils import StreamingPlayer
 
         try:
-            self.logger.debug("Streaming server audio data")
+            logger.debug("Streaming server audio data")
 
             # Stream using StreamingPlayer
             player = StreamingPlayer(provider_name="Chatterbox")
             player.play_chunks(iter([audio_data]))
 
-            self.logger.debug("Audio streaming completed")
+            logger.debug("Audio streaming completed")
 
         except (ValueError, RuntimeError, MemoryError) as e:
-            self.logger.error(f"Unexpected audio streaming error: {type(e).__name__}: {e}")
+            logger.error(f"Unexpected audio streaming error: {type(e).__name__}: {e}")
             raise AudioPlaybackError(f"Audio streaming failed unexpectedly: {type(e).__name__}: {e}") from e
 
     def _save_audio_data(self, audio_data: bytes, output_path: str, output_format: str) -> None:
@@ -204,7 +205,7 @@ class ChatterboxProvider(TTSProvider):
                 convert_with_cleanup(wav_path, output_path, output_format)
 
         except (IOError, OSError, ValueError) as e:
-            self.logger.error(f"Failed to save audio data: {e}")
+            logger.error(f"Failed to save audio data: {e}")
             raise ProviderError(f"Failed to save audio: {e}") from e
 
     def get_info(self) -> Optional[ProviderInfo]:
@@ -230,3 +231,6 @@ class ChatterboxProvider(TTSProvider):
             "output_format": "WAV 22kHz",
             "model": "Resemble AI Chatterbox (0.5B parameters)",
         }
+
+
+PROVIDER_CLASS = ChatterboxProvider
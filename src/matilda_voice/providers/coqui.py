@@ -20,6 +20,8 @@ from ..exceptions import AudioPlaybackError, DependencyError, ProviderError
 from ..internal.audio_utils import convert_with_cleanup, parse_bool_param
 from ..internal.types import ProviderInfo
 
+logger = logging.getLogger(__name__)
+
 
 class CoquiProvider(TTSProvider):
     """Coqui TTS provider for local speech synthesis with voice cloning."""
@@ -29,7 +31,6 @@ class CoquiProvider(TTSProvider):
 
     def __init__(self) -> None:
         self.tts = None
-        self.logger = logging.getLogger(__name__)
         self._model_name: str = self.DEFAULT_MODEL
 
     def _lazy_load(self, model_name: Optional[str] = None) -> None:
@@ -68,10 +69,10 @@ class CoquiProvider(TTSProvider):
 
             return bool(torch.cuda.is_available())
         except ImportError:
-            self.logger.debug("PyTorch not available, using CPU")
+            logger.debug("PyTorch not available, using CPU")
             return False
         except (RuntimeError, AttributeError) as e:
-            self.logger.warning(f"Error checking CUDA availability: {e}")
+            logger.warning(f"Error checking CUDA availability: {e}")
             return False
 
     def synthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
@@ -120,7 +121,7 @@ class CoquiProvider(TTSProvider):
                         language=language,
                     )
                 else:
-                    self.logger.warning("Voice cloning requires XTTS model; using default voice")
+                    logger.warning("Voice cloning requires XTTS model; using default voice")
                     self.tts.tts_to_file(text=text, file_path=synthesis_path)
             else:
                 # Standard synthesis
@@ -140,7 +141,7 @@ class CoquiProvider(TTSProvider):
                 convert_with_cleanup(synthesis_path, output_path, output_format)
 
         except (IOError, OSError, RuntimeError) as e:
-            self.logger.error(f"Synthesis failed: {e}")
+            logger.error(f"Synthesis failed: {e}")
             raise ProviderError(f"Coqui TTS synthesis failed: {e}") from e
 
     def _stream_audio_file(self, audio_path: str) -> None:
@@ -148,7 +149,7 @@ class CoquiProvider(TTSProvider):
         from ..internal.audio_utils import StreamingPlayer
 
         try:
-            self.logger.debug(f"Streaming audio file: {audio_path}")
+            logger.debug(f"Streaming audio file: {audio_path}")
 
             with open(audio_path, "rb") as f:
                 audio_data = f.read()
@@ -156,10 +157,10 @@ class CoquiProvider(TTSProvider):
             player = StreamingPlayer(provider_name="Coqui")
             player.play_chunks(iter([audio_data]))
 
-            self.logger.debug("Audio streaming completed")
+            logger.debug("Audio streaming completed")
 
         except (IOError, OSError, ValueError) as e:
-            self.logger.error(f"Audio streaming error: {e}")
+            logger.error(f"Audio streaming error: {e}")
             raise AudioPlaybackError(f"Audio streaming failed: {e}") from e
 
     def get_info(self) -> Optional[ProviderInfo]:
@@ -196,3 +197,6 @@ class CoquiProvider(TTSProvider):
             return ["(Coqui TTS not installed)"]
         except (RuntimeError, AttributeError):
             return ["(Unable to list models)"]
+
+
+PROVIDER_CLASS = CoquiProvider
@@ -16,11 +16,12 @@ from ..internal.audio_utils import (
 from ..internal.config import get_config_value
 from ..internal.types import ProviderInfo
 
+logger = logging.getLogger(__name__)
+
 
 class EdgeTTSProvider(TTSProvider):
     def __init__(self) -> None:
         self.edge_tts: Optional[Any] = None
-        self.logger = logging.getLogger(__name__)
         self._executor = ThreadPoolExecutor(
             max_workers=get_config_value("thread_pool_max_workers"), thread_name_prefix="edge_tts"
         )
@@ -81,27 +82,27 @@ class EdgeTTSProvider(TTSProvider):
                 raise
             except BrokenPipeError:
                 # Silently ignore broken pipe when stdout/stdin is closed
-                self.logger.debug("Broken pipe error - output stream was closed")
+                logger.debug("Broken pipe error - output stream was closed")
                 return None
         except KeyboardInterrupt:
             # Clean shutdown on Ctrl+C - propagate without logging
             raise
         except BrokenPipeError:
             # Silently ignore broken pipe errors
-            self.logger.debug("Broken pipe error in async handler")
+            logger.debug("Broken pipe error in async handler")
             return None
 
     async def _synthesize_async(
         self, text: str, output_path: str, voice: str, rate: str, pitch: str, output_format: str = "mp3"
     ) -> None:
         try:
-            self.logger.debug(f"Creating Edge TTS communication with voice: {voice}")
+            logger.debug(f"Creating Edge TTS communication with voice: {voice}")
             if self.edge_tts is None:
                 raise ProviderError("Edge TTS module not loaded")
 
             # Handle SSML input - Edge TTS doesn't support SSML, convert to plain text
             if self._is_ssml(text):
-                self.logger.warning(
+                logger.warning(
                     "Edge TTS doesn't support SSML. Converting to plain text. "
                     "Use Azure Cognitive Services provider for full SSML support."
                 )
@@ -110,7 +111,7 @@ class EdgeTTSProvider(TTSProvider):
             communicate = self.edge_tts.Communicate(text, voice, rate=rate, pitch=pitch)
 
             if output_format == "mp3":
-                self.logger.debug(f"Saving MP3 directly to {output_path}")
+                logger.debug(f"Saving MP3 directly to {output_path}")
                 await communicate.save(output_path)
             else:
                 # For other formats, save as MP3 first then convert
@@ -119,42 +120,42 @@ class EdgeTTSProvider(TTSProvider):
                 with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
                     mp3_path = tmp.name
 
-                self.logger.debug(f"Saving MP3 to temporary file: {mp3_path}")
+                logger.debug(f"Saving MP3 to temporary file: {mp3_path}")
                 await communicate.save(mp3_path)
 
                 # Convert using utility function with cleanup
                 convert_with_cleanup(mp3_path, output_path, output_format)
         except ConnectionError as e:
-            self.logger.error(f"Network connection error during Edge TTS synthesis: {e}")
+            logger.error(f"Network connection error during Edge TTS synthesis: {e}")
             raise NetworkError(f"Edge TTS connection failed: {e}. Check your internet connection and try again.") from e
         except OSError as e:
-            self.logger.error(f"File system error during Edge TTS synthesis: {e}")
+            logger.error(f"File system error during Edge TTS synthesis: {e}")
             raise ProviderError(f"Edge TTS file operation failed: {e}") from e
         except (RuntimeError, ValueError, AttributeError) as e:
             error_msg = str(e).lower()
             if any(keyword in error_msg for keyword in ["internet", "network", "connection", "dns", "timeout"]):
-                self.logger.error(f"Network-related error during Edge TTS synthesis: {e}")
+                logger.error(f"Network-related error during Edge TTS synthesis: {e}")
                 raise NetworkError(f"Edge TTS network error: {e}. Check your internet connection and try again.") from e
             else:
-                self.logger.error(f"Edge TTS synthesis failed with unexpected error: {type(e).__name__}: {e}")
+                logger.error(f"Edge TTS synthesis failed with unexpected error: {type(e).__name__}: {e}")
                 raise ProviderError(f"Edge TTS synthesis failed: {type(e).__name__}: {e}") from e
 
     async def _stream_async(self, text: str, voice: str, rate: str, pitch: str) -> None:
         """Stream TTS audio directly to speakers without saving to file."""
-        self.logger.debug(f"Starting Edge TTS streaming with voice: {voice}")
+        logger.debug(f"Starting Edge TTS streaming with voice: {voice}")
         if self.edge_tts is None:
             raise ProviderError("Edge TTS module not loaded")
 
         # Check for audio environment first
         audio_env = await check_audio_environment_async()
         if not audio_env["available"]:
-            self.logger.warning(f"Audio streaming not available: {audio_env['reason']}")
+            logger.warning(f"Audio streaming not available: {audio_env['reason']}")
             return await self._stream_via_tempfile(text, voice, rate, pitch)
 
         try:
             # Handle SSML input - Edge TTS doesn't support SSML, convert to plain text
             if self._is_ssml(text):
-                self.logger.warning(
+                logger.warning(
                     "Edge TTS doesn't support SSML. Converting to plain text. "
                     "Use Azure Cognitive Services provider for full SSML support."
                 )
@@ -179,10 +180,10 @@ class EdgeTTSProvider(TTSProvider):
         except (ConnectionError, OSError, RuntimeError, ValueError) as e:
             error_str = str(e).lower()
             if "internet" in error_str or "network" in error_str or "connection" in error_str:
-                self.logger.error(f"Network error during Edge TTS streaming: {e}")
+                logger.error(f"Network error during Edge TTS streaming: {e}")
                 raise NetworkError("Edge TTS requires internet connection. Check your network and try again.") from e
             else:
-                self.logger.error(f"Edge TTS streaming failed: {e}")
+                logger.error(f"Edge TTS streaming failed: {e}")
                 raise ProviderError(f"Edge TTS streaming failed: {e}") from e
 
     async def _stream_via_tempfile(self, text: str, voice: str, rate: str, pitch: str) -> None:
@@ -201,7 +202,7 @@ class EdgeTTSProvider(TTSProvider):
             lambda: stream_via_tempfile(
                 synthesize_func=sync_synthesize,
                 text=text,
-                logger=self.logger,
+                logger=logger,
                 file_suffix=".mp3",
                 voice=voice,
                 rate=rate,
@@ -249,11 +250,11 @@ class EdgeTTSProvider(TTSProvider):
             voices = [v["ShortName"] for v in voice_list]
         except (ImportError, RuntimeError, OSError) as e:
             # Network issues, asyncio problems, or edge-tts import failures
-            self.logger.warning(f"Could not fetch voice list from Edge TTS: {e}")
+            logger.warning(f"Could not fetch voice list from Edge TTS: {e}")
             voices = ["en-US-JennyNeural", "en-US-GuyNeural", "en-GB-SoniaNeural"]
         except (AttributeError, TypeError, ValueError) as e:
             # Unexpected errors
-            self.logger.error(f"Unexpected error fetching Edge TTS voices: {e}")
+            logger.error(f"Unexpected error fetching Edge TTS voices: {e}")
             voices = ["en-US-JennyNeural", "en-US-GuyNeural", "en-GB-SoniaNeural"]
 
         result: ProviderInfo = {
@@ -269,3 +270,6 @@ class EdgeTTSProvider(TTSProvider):
             "sample_voices": voices if voices else [],
         }
         return result
+
+
+PROVIDER_CLASS = EdgeTTSProvider
@@ -27,6 +27,8 @@ from ..internal.http_retry import request_with_retry, stream_with_retry
 from ..internal.types import ProviderInfo
 from ..speech_synthesis.ssml.utils import is_ssml, strip_ssml_tags
 
+logger = logging.getLogger(__name__)
+
 
 class ElevenLabsProvider(TTSProvider):
     """ElevenLabs TTS provider with premium voice cloning and custom voices."""
@@ -45,7 +47,6 @@ class ElevenLabsProvider(TTSProvider):
     }
 
     def __init__(self) -> None:
-        self.logger = logging.getLogger(__name__)
         self._voices_cache: Optional[List[Dict[str, Any]]] = None
         self.base_url = "https://api.elevenlabs.io/v1"
 
@@ -114,11 +115,11 @@ class ElevenLabsProvider(TTSProvider):
 
                     self._voices_cache = voices
                 else:
-                    self.logger.warning(f"Failed to fetch ElevenLabs voices: {response.status_code}")
+                    logger.warning(f"Failed to fetch ElevenLabs voices: {response.status_code}")
                     self._voices_cache = []
 
             except (httpx.RequestError, ValueError, KeyError) as e:
-                self.logger.warning(f"Failed to fetch ElevenLabs voices: {e}")
+                logger.warning(f"Failed to fetch ElevenLabs voices: {e}")
                 self._voices_cache = []
 
         return self._voices_cache
@@ -166,7 +167,7 @@ class ElevenLabsProvider(TTSProvider):
 
         # Handle SSML (ElevenLabs doesn't support SSML, so strip tags)
         if is_ssml(text):
-            self.logger.warning("ElevenLabs doesn't support SSML. Converting to plain text.")
+            logger.warning("ElevenLabs doesn't support SSML. Converting to plain text.")
             text = strip_ssml_tags(text)
 
         # Parse voice name
@@ -196,7 +197,7 @@ class ElevenLabsProvider(TTSProvider):
                     "voice_settings": {"stability": stability, "similarity_boost": similarity_boost, "style": style},
                 }
 
-                self.logger.info(f"Generating speech with ElevenLabs voice '{voice_name}' (ID: {voice_id})")
+                logger.info(f"Generating speech with ElevenLabs voice '{voice_name}' (ID: {voice_id})")
 
                 # Make synthesis request (idempotent=False to avoid duplicate charges)
                 response = self._make_request("POST", f"/text-to-speech/{voice_id}", json=payload, idempotent=False)
@@ -249,12 +250,12 @@ class ElevenLabsProvider(TTSProvider):
         self, text: str, voice_id: str, voice_name: str, stability: float, similarity_boost: float, style: float
     ) -> None:
         """Stream TTS audio in real-time with minimal latency."""
-        self.logger.debug(f"Starting ElevenLabs TTS streaming with voice: {voice_name}")
+        logger.debug(f"Starting ElevenLabs TTS streaming with voice: {voice_name}")
 
         # Check for audio environment first
         audio_env = check_audio_environment()
         if not audio_env["available"]:
-            self.logger.warning(f"Audio streaming not available: {audio_env['reason']}")
+            logger.warning(f"Audio streaming not available: {audio_env['reason']}")
             return self._stream_via_tempfile(text, voice_id, voice_name, stability, similarity_boost, style)
 
         try:
@@ -295,7 +296,7 @@ class ElevenLabsProvider(TTSProvider):
                 player.play_chunks(response.iter_bytes(chunk_size=get_config_value("http_streaming_chunk_size")))
 
         except (httpx.RequestError, ConnectionError, ValueError, RuntimeError) as e:
-            self.logger.error(f"ElevenLabs TTS streaming failed: {e}")
+            logger.error(f"ElevenLabs TTS streaming failed: {e}")
             classify_and_raise(e, "ElevenLabs")
 
     def _stream_via_tempfile(
@@ -328,7 +329,7 @@ class ElevenLabsProvider(TTSProvider):
         stream_via_tempfile(
             synthesize_func=synthesize_to_file,
             text=text,
-            logger=self.logger,
+            logger=logger,
             file_suffix=".mp3",
             voice_id=voice_id,
             voice_name=voice_name,
@@ -396,3 +397,6 @@ class ElevenLabsProvider(TTSProvider):
                 "output_format": "MP3 (converted to other formats via ffmpeg)",
             },
         )
+
+
+PROVIDER_CLASS = ElevenLabsProvider
@@ -22,6 +22,8 @@ from ..internal.http_retry import request_with_retry
 from ..internal.types import ProviderInfo
 from ..speech_synthesis.ssml.utils import is_ssml
 
+logger = logging.getLogger(__name__)
+
 
 class GoogleTTSProvider(TTSProvider):
     """Google Cloud TTS provider with 380+ voices and full SSML support."""
@@ -44,7 +46,6 @@ class GoogleTTSProvider(TTSProvider):
     }
 
     def __init__(self) -> None:
-        self.logger = logging.getLogger(__name__)
         self._voices_cache: Optional[List[str]] = None
         self.base_url = "https://texttospeech.googleapis.com/v1"
         self._client: Optional[Any] = None
@@ -207,7 +208,7 @@ class GoogleTTSProvider(TTSProvider):
                 for voice in response.voices:
                     voices.append(voice.name)
                 self._voices_cache = voices
-                self.logger.info(f"Fetched {len(voices)} Google voices via service account")
+                logger.info(f"Fetched {len(voices)} Google voices via service account")
             else:
                 # Use REST API with API key
                 response = self._make_request("GET", "/voices")
@@ -218,12 +219,12 @@ class GoogleTTSProvider(TTSProvider):
                     for voice in data.get("voices", []):
                         voices.append(voice["name"])
                     self._voices_cache = voices
-                    self.logger.info(f"Fetched {len(voices)} Google voices via API key")
+                    logger.info(f"Fetched {len(voices)} Google voices via API key")
                 else:
-                    self.logger.warning(f"Failed to fetch voices: HTTP {response.status_code}")
+                    logger.warning(f"Failed to fetch voices: HTTP {response.status_code}")
                     self._voices_cache = []
         except (httpx.RequestError, ValueError, KeyError) as e:
-            self.logger.warning(f"Failed to fetch Google voices: {e}")
+            logger.warning(f"Failed to fetch Google voices: {e}")
             self._voices_cache = []
 
         return self._voices_cache
@@ -253,11 +254,11 @@ class GoogleTTSProvider(TTSProvider):
             language_code = f"{parts[0]}-{parts[1]}"
         else:
             language_code = "en-US"
-            self.logger.warning(f"Could not parse language from voice '{voice_name}', using en-US")
+            logger.warning(f"Could not parse language from voice '{voice_name}', using en-US")
 
-        self.logger.info(f"Generating speech with Google voice '{voice_name}'")
+        logger.info(f"Generating speech with Google voice '{voice_name}'")
         if use_ssml:
-            self.logger.info("Using SSML input")
+            logger.info("Using SSML input")
 
         try:
             client = self._get_client()
@@ -286,7 +287,7 @@ class GoogleTTSProvider(TTSProvider):
                 )
 
                 audio_content = response.audio_content
-                self.logger.info("Synthesis completed via service account")
+                logger.info("Synthesis completed via service account")
 
             else:
                 # Use REST API with API key
@@ -325,7 +326,7 @@ class GoogleTTSProvider(TTSProvider):
                 # Get audio content from response
                 response_data = response.json()
                 audio_content = base64.b64decode(response_data["audioContent"])
-                self.logger.info("Synthesis completed via API key")
+                logger.info("Synthesis completed via API key")
 
             # Save audio content to temporary file
             with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
@@ -370,3 +371,6 @@ class GoogleTTSProvider(TTSProvider):
                 raise QuotaError(f"Google Cloud quota/billing issue: {e}") from e
             else:
                 raise ProviderError(f"Google TTS synthesis failed: {e}") from e
+
+
+PROVIDER_CLASS = GoogleTTSProvider
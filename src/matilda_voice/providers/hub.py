@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import base64
+import binascii
 import logging
+from pathlib import Path
 from typing import Any, Optional
 
 from matilda_transport import HubClient
@@ -10,11 +11,10 @@ from ..base import TTSProvider
 from ..exceptions import ProviderError
 from ..internal.audio_utils import parse_bool_param, stream_via_tempfile
 
+logger = logging.getLogger(__name__)
 
-class HubTTSProvider(TTSProvider):
-    def __init__(self) -> None:
-        self.logger = logging.getLogger(__name__)
 
+class HubTTSProvider(TTSProvider):
     def synthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
         stream = parse_bool_param(kwargs.get("stream"), False)
         output_format = kwargs.get("output_format", "wav")
@@ -24,7 +24,7 @@ class HubTTSProvider(TTSProvider):
             stream_via_tempfile(
                 self._synthesize_to_file,
                 text,
-                self.logger,
+                logger,
                 file_suffix=f".{output_format}",
                 voice=voice,
                 output_format=output_format,
@@ -50,9 +50,12 @@ class HubTTSProvider(TTSProvider):
             message = error.get("message") if isinstance(error, dict) else str(error)
             raise ProviderError(message or "hub request failed")
         result = response.get("result") or {}
-        audio_b64 = result.get("audio")
-        if not audio_b64:
+        audio = result.get("audio")
+        if not audio:
             raise ProviderError("hub response missing audio payload")
-        audio_bytes = base64.b64decode(audio_b64)
-        with open(output_path, "wb") as audio_file:
-            audio_file.write(audio_bytes)
+        # Transports with binary framing hand back raw bytes; JSON ones send base64 text
+        audio_bytes = audio if isinstance(audio, (bytes, bytearray)) else binascii.a2b_base64(audio)
+        Path(output_path).write_bytes(audio_bytes)
+
+
+PROVIDER_CLASS = HubTTSProvider
@@ -1,3 +1,6 @@
+from types import MappingProxyType
+from typing import Mapping
+
 SAMPLE_VOICES = {
     "ar-EG-SalmaNeural": "Arabic (Egypt) - Salma",
     "de-DE-KatjaNeural": "German (Germany) - Katja",
@@ -25,13 +28,17 @@ SAMPLE_VOICES = {
 
 DEFAULT_VOICE = "en-US-EmmaMultilingualNeural"
 
+# Built once at import; callers get a fresh list or a read-only view instead of a dict copy
+_SAMPLE_VOICE_NAMES = tuple(SAMPLE_VOICES)
+_SAMPLE_VOICE_DESCRIPTIONS = MappingProxyType(SAMPLE_VOICES)
+
 
 def get_sample_voices() -> list[str]:
-    return list(SAMPLE_VOICES.keys())
+    return list(_SAMPLE_VOICE_NAMES)
 
 
-def get_voice_descriptions() -> dict[str, str]:
-    return SAMPLE_VOICES.copy()
+def get_voice_descriptions() -> Mapping[str, str]:
+    return _SAMPLE_VOICE_DESCRIPTIONS
 
 
 def normalize_voice_name(voice: str) -> str:
@@ -22,6 +22,8 @@ from ..internal.http_retry import call_with_retry
 from ..internal.types import ProviderInfo
 from ..speech_synthesis.ssml.utils import is_ssml, strip_ssml_tags
 
+logger = logging.getLogger(__name__)
+
 
 class OpenAITTSProvider(TTSProvider):
     """OpenAI TTS API provider with 6 high-quality voices."""
@@ -37,7 +39,6 @@ class OpenAITTSProvider(TTSProvider):
     }
 
     def __init__(self) -> None:
-        self.logger = logging.getLogger(__name__)
         self._client: Any | None = None
 
     def _get_retry_exceptions(self) -> tuple[type[BaseException], ...]:
@@ -76,12 +77,12 @@ class OpenAITTSProvider(TTSProvider):
 
         # Handle SSML (OpenAI doesn't support SSML, so strip tags)
         if is_ssml(text):
-            self.logger.warning("OpenAI TTS doesn't support SSML. Converting to plain text.")
+            logger.warning("OpenAI TTS doesn't support SSML. Converting to plain text.")
             text = strip_ssml_tags(text)
 
         # Validate voice
         if voice not in self.VOICES:
-            self.logger.warning(f"Unknown OpenAI voice '{voice}', using 'nova'")
+            logger.warning(f"Unknown OpenAI voice '{voice}', using 'nova'")
             voice = "nova"
 
         try:
@@ -95,7 +96,7 @@ class OpenAITTSProvider(TTSProvider):
                 client = self._get_client()
 
                 # Generate speech
-                self.logger.info(f"Generating speech with OpenAI voice '{voice}'")
+                logger.info(f"Generating speech with OpenAI voice '{voice}'")
 
                 # OpenAI TTS API call
                 response = call_with_retry(
@@ -138,12 +139,12 @@ class OpenAITTSProvider(TTSProvider):
 
     def _stream_realtime(self, text: str, voice: str) -> None:
         """Stream TTS audio in real-time with minimal latency."""
-        self.logger.debug(f"Starting OpenAI TTS streaming with voice: {voice}")
+        logger.debug(f"Starting OpenAI TTS streaming with voice: {voice}")
 
         # Check for audio environment first
         audio_env = check_audio_environment()
         if not audio_env["available"]:
-            self.logger.warning(f"Audio streaming not available: {audio_env['reason']}")
+            logger.warning(f"Audio streaming not available: {audio_env['reason']}")
             return self._stream_via_tempfile(text, voice)
 
         try:
@@ -170,7 +171,7 @@ class OpenAITTSProvider(TTSProvider):
             player.play_chunks(response.iter_bytes(chunk_size=get_config_value("http_streaming_chunk_size")))
 
         except (ConnectionError, ValueError, RuntimeError, AttributeError) as e:
-            self.logger.error(f"OpenAI TTS streaming failed: {e}")
+            logger.error(f"OpenAI TTS streaming failed: {e}")
             classify_and_raise(e, "OpenAI")
 
     def _stream_via_tempfile(self, text: str, voice: str) -> None:
@@ -184,7 +185,7 @@ class OpenAITTSProvider(TTSProvider):
             response.stream_to_file(output_path)
 
         stream_via_tempfile(
-            synthesize_func=synthesize_to_file, text=text, logger=self.logger, file_suffix=".mp3", voice=voice
+            synthesize_func=synthesize_to_file, text=text, logger=logger, file_suffix=".mp3", voice=voice
         )
 
     def get_info(self) -> Optional[ProviderInfo]:
@@ -216,3 +217,6 @@ class OpenAITTSProvider(TTSProvider):
                 "output_format": "MP3 (converted to other formats via ffmpeg)",
             },
         )
+
+
+PROVIDER_CLASS = OpenAITTSProvider
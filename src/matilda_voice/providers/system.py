@@ -1,42 +1,37 @@
 import logging
-import os
+import shutil
 import subprocess
-import tempfile
 from typing import Any, Optional
 
 from ..base import TTSProvider
-from ..exceptions import ProviderError
-from ..internal.audio_utils import convert_audio, parse_bool_param
+from ..exceptions import DependencyError, ProviderError
+from ..internal.audio_utils import parse_bool_param
 from ..internal.types import ProviderInfo
 
+logger = logging.getLogger(__name__)
+
+# Supported system engines, in order of preference
+_ENGINES = ("espeak", "festival", "say")
+
+# Emotion hints mapped to engine arguments; unknown emotions use the defaults
+_ESPEAK_EMOTION_ARGS = {
+    "excited": ("-p", "60", "-s", "180"),
+    "soft": ("-p", "30", "-s", "120"),
+    "monotone": ("-p", "40", "-s", "150"),
+}
+_ESPEAK_DEFAULT_ARGS = ("-p", "50", "-s", "160")
+_SAY_EMOTION_VOICES = {"excited": "Samantha", "soft": "Whisper", "monotone": "Ralph"}
+_SAY_EMOTION_RATES = {"excited": "200", "soft": "120", "monotone": "150"}
+_SAY_DEFAULT_RATE = "160"
+
 
 class SystemTTSProvider(TTSProvider):
     def __init__(self) -> None:
-        self.logger = logging.getLogger(__name__)
         self.available_engines = self._detect_available_engines()
 
     def _detect_available_engines(self) -> list[str]:
-        engines = []
-
-        try:
-            subprocess.run(["espeak", "--version"], capture_output=True, check=True)
-            engines.append("espeak")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
-        try:
-            subprocess.run(["festival", "--version"], capture_output=True, check=True)
-            engines.append("festival")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
-        try:
-            subprocess.run(["say", "-v", "?"], capture_output=True, check=True)
-            engines.append("say")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
-        return engines
+        # A PATH lookup is enough here; probing each binary would fork a process per engine
+        return [engine for engine in _ENGINES if shutil.which(engine) is not None]
 
     def synthesize(self, text: str, output_path: Optional[str], **kwargs: Any) -> None:
         stream = parse_bool_param(kwargs.get("stream"), False)
@@ -84,16 +79,15 @@ class SystemTTSProvider(TTSProvider):
         return None
 
     def _speak(self, engine: str, text: str, emotion: str, voice: Optional[str]) -> None:
-        if engine == "espeak":
-            self._run_espeak(text, emotion, voice, None)
-            return
-        if engine == "festival":
-            self._run_festival(text)
-            return
-        if engine == "say":
-            self._run_say(text, emotion, voice, None)
-            return
-        raise ProviderError(f"Unknown system TTS engine '{engine}'")
+        match engine:
+            case "espeak":
+                self._run_espeak(text, emotion, voice, None)
+            case "festival":
+                self._run_festival(text)
+            case "say":
+                self._run_say(text, emotion, voice, None)
+            case _:
+                raise ProviderError(f"Unknown system TTS engine '{engine}'")
 
     def _speak_to_file(
         self,
@@ -104,26 +98,27 @@ class SystemTTSProvider(TTSProvider):
         output_path: str,
         output_format: str,
     ) -> None:
-        if engine == "espeak":
-            if output_format == "wav":
+        match engine:
+            case "espeak" if output_format == "wav":
                 self._run_espeak(text, emotion, voice, output_path)
-                return
-
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                tmp_path = tmp_file.name
-            try:
-                self._run_espeak(text, emotion, voice, tmp_path)
-                convert_audio(tmp_path, output_path, output_format)
-            finally:
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
-            return
+            case "espeak":
+                self._run_espeak_converted(text, emotion, voice, output_path)
+            case "say":
+                self._run_say(text, emotion, voice, output_path)
+            case _:
+                raise ProviderError(f"System TTS engine '{engine}' does not support file output")
+
+    def _espeak_command(self, text: str, emotion: str, voice: Optional[str], output_args: list[str]) -> list[str]:
+        cmd = ["espeak"]
 
-        if engine == "say":
-            self._run_say(text, emotion, voice, output_path)
-            return
+        if voice:
+            cmd.extend(["-v", voice])
+
+        cmd.extend(_ESPEAK_EMOTION_ARGS.get(emotion, _ESPEAK_DEFAULT_ARGS))
 
-        raise ProviderError(f"System TTS engine '{engine}' does not support file output")
+        cmd.extend(output_args)
+        cmd.append(text)
+        return cmd
 
     def _run_espeak(
         self,
@@ -132,29 +127,39 @@ class SystemTTSProvider(TTSProvider):
         voice: Optional[str],
         output_path: Optional[str],
     ) -> None:
-        cmd = ["espeak"]
-
-        if voice:
-            cmd.extend(["-v", voice])
-
-        if emotion == "excited":
-            cmd.extend(["-p", "60", "-s", "180"])
-        elif emotion == "soft":
-            cmd.extend(["-p", "30", "-s", "120"])
-        elif emotion == "monotone":
-            cmd.extend(["-p", "40", "-s", "150"])
-        else:
-            cmd.extend(["-p", "50", "-s", "160"])
-
-        if output_path:
-            cmd.extend(["-w", output_path])
-
-        cmd.append(text)
-
+        cmd = self._espeak_command(text, emotion, voice, ["-w", output_path] if output_path else [])
         result = subprocess.run(cmd, capture_output=True)
         if result.returncode != 0:
             raise ProviderError("espeak synthesis failed")
 
+    def _run_espeak_converted(self, text: str, emotion: str, voice: Optional[str], output_path: str) -> None:
+        """Pipe espeak's WAV output straight into ffmpeg, with no intermediate file."""
+        espeak = subprocess.Popen(
+            self._espeak_command(text, emotion, voice, ["--stdout"]),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        assert espeak.stdout is not None
+        try:
+            ffmpeg = subprocess.Popen(
+                ["ffmpeg", "-f", "wav", "-i", "pipe:0", "-y", output_path],
+                stdin=espeak.stdout,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError as e:
+            espeak.kill()
+            espeak.wait()
+            raise DependencyError("ffmpeg not found. Please install ffmpeg for format conversion.") from e
+        finally:
+            # Drop the parent's read end so espeak gets SIGPIPE if ffmpeg exits early
+            espeak.stdout.close()
+
+        ffmpeg_returncode = ffmpeg.wait()
+        if espeak.wait() != 0:
+            raise ProviderError("espeak synthesis failed")
+        if ffmpeg_returncode != 0:
+            raise ProviderError(f"Audio conversion failed: ffmpeg exited with status {ffmpeg_returncode}")
+
     def _run_festival(self, text: str) -> None:
         result = subprocess.run(["festival", "--tts"], input=text, text=True, capture_output=True)
         if result.returncode != 0:
@@ -163,24 +168,11 @@ class SystemTTSProvider(TTSProvider):
     def _run_say(self, text: str, emotion: str, voice: Optional[str], output_path: Optional[str]) -> None:
         cmd = ["say"]
 
-        if voice:
-            cmd.extend(["-v", voice])
-        elif emotion == "excited":
-            cmd.extend(["-v", "Samantha"])
-        elif emotion == "soft":
-            cmd.extend(["-v", "Whisper"])
-        elif emotion == "monotone":
-            cmd.extend(["-v", "Ralph"])
-
-        rate = "160"
-        if emotion == "excited":
-            rate = "200"
-        elif emotion == "soft":
-            rate = "120"
-        elif emotion == "monotone":
-            rate = "150"
-
-        cmd.extend(["-r", rate])
+        say_voice = voice or _SAY_EMOTION_VOICES.get(emotion)
+        if say_voice:
+            cmd.extend(["-v", say_voice])
+
+        cmd.extend(["-r", _SAY_EMOTION_RATES.get(emotion, _SAY_DEFAULT_RATE)])
 
         if output_path:
             cmd.extend(["-o", output_path])
@@ -190,3 +182,6 @@ class SystemTTSProvider(TTSProvider):
         result = subprocess.run(cmd, capture_output=True)
         if result.returncode != 0:
             raise ProviderError("say synthesis failed")
+
+
+PROVIDER_CLASS = SystemTTSProvider
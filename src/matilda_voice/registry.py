@@ -21,3 +21,7 @@ PROVIDER_SHORTCUTS = {
     "system": "system",
     "hub": "hub",
 }
+
+# Providers that synthesize locally in Python-heavy model code and hold the GIL,
+# so the server runs them in worker processes rather than threads
+CPU_BOUND_PROVIDERS = frozenset({"chatterbox", "coqui"})
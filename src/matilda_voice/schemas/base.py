@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SchemaModel(BaseModel):
+    """Base for wire schemas: immutable, and unknown fields are ignored rather than stored per instance."""
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
@@ -2,20 +2,16 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from .base import SchemaModel
 
 
-class SpeakRequest(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class SpeakRequest(SchemaModel):
     text: str
     voice: Optional[str] = None
     provider: Optional[str] = None
 
 
-class SynthesizeRequest(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class SynthesizeRequest(SchemaModel):
     text: str
     voice: Optional[str] = None
     provider: Optional[str] = None
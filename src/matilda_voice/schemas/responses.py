@@ -2,20 +2,16 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from .base import SchemaModel
 
 
-class ErrorDetail(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class ErrorDetail(SchemaModel):
     message: str
     code: str
     retryable: bool
 
 
-class EnvelopeBase(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class EnvelopeBase(SchemaModel):
     request_id: str
     service: str
     task: str
@@ -26,55 +22,39 @@ class EnvelopeBase(BaseModel):
     error: Optional[ErrorDetail] = None
 
 
-class SpeakResult(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class SpeakResult(SchemaModel):
     text: str
     voice: Optional[str] = None
 
 
-class SpeakResponse(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class SpeakResponse(SchemaModel):
     result: SpeakResult
 
 
-class SynthesizeResult(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class SynthesizeResult(SchemaModel):
     audio: str
     format: str
     text: str
     size_bytes: int
 
 
-class SynthesizeResponse(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class SynthesizeResponse(SchemaModel):
     result: SynthesizeResult
 
 
-class ProvidersResult(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class ProvidersResult(SchemaModel):
     providers: List[str]
 
 
-class ProvidersResponse(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class ProvidersResponse(SchemaModel):
     result: ProvidersResult
 
 
-class ReloadResult(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class ReloadResult(SchemaModel):
     message: str
 
 
-class ReloadResponse(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class ReloadResponse(SchemaModel):
     result: ReloadResult
 
 
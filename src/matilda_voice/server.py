@@ -13,22 +13,35 @@ Usage:
 
 import argparse
 import asyncio
-import base64
+import binascii
+import contextlib
+import functools
+import io
 import json
 import logging
+import mimetypes
+import multiprocessing
 import os
+import queue
 import secrets
+import sys
 import tempfile
-import uuid
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Awaitable, Callable, Optional
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType, ModuleType
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar, cast
 
 from aiohttp import web
-from aiohttp.web import Request, Response, StreamResponse
+from aiohttp.abc import AbstractStreamWriter
+from aiohttp.web import BaseRequest, FileResponse, Request, Response, StreamResponse
 from matilda_transport import ensure_pipe_supported, prepare_unix_socket, resolve_transport
 
+from .exceptions import ProviderLoadError
+from .internal.config import reload_config
 from .internal.security import get_allowed_origins
 from .internal.token_storage import get_or_create_token
+from .registry import CPU_BOUND_PROVIDERS, PROVIDER_SHORTCUTS
 from .schemas.responses import (
     ErrorEnvelope,
     ProvidersEnvelope,
@@ -39,78 +52,119 @@ from .schemas.responses import (
 
 logger = logging.getLogger(__name__)
 
-# Thread pool for file I/O operations to prevent blocking the main loop
-# and to separate I/O tasks from heavy TTS synthesis tasks
-IO_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="voice_io")
+try:
+    import orjson
+
+    _json_dumps: Callable[[Any], bytes] = orjson.dumps
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+@functools.cache
+def _hooks() -> ModuleType:
+    """Return the app_hooks module, imported on first use.
+
+    The hooks package pulls in every provider and the CLI engine, so it stays
+    out of server import (and clear of circular imports); after the first
+    call handlers pay a single cached lookup instead of an import statement.
+    """
+    from . import app_hooks
+
+    return app_hooks
+
+
+def _request_id() -> str:
+    # Opaque per-response id; raw hex skips building and formatting a UUID object
+    return os.urandom(16).hex()
+
+
+def _json_response(payload: Dict[str, Any], status: int = 200) -> Response:
+    """Build a JSON response from encoded bytes, skipping aiohttp's str round trip."""
+    return Response(body=_json_dumps(payload), status=status, content_type="application/json")
+
 
 # Security: API Token Management
 API_TOKEN = get_or_create_token()
+# Token length is not secret (it is fixed by the generator), so a mismatch can be rejected early
+_API_TOKEN_LEN = len(API_TOKEN)
+# Compared as bytes: str compare_digest raises TypeError on non-ASCII input
+_API_TOKEN_BYTES = API_TOKEN.encode("utf-8")
+
+
+def _auth_error_template(message: str, code: str) -> bytes:
+    """Encode an auth error envelope once, leaving a %s slot for the request id."""
+    return _json_dumps(
+        {
+            "request_id": "%s",
+            "service": "voice",
+            "task": "auth",
+            "provider": None,
+            "model": None,
+            "usage": None,
+            "error": {"message": message, "code": code, "retryable": False},
+        }
+    )
+
+
+_UNAUTHORIZED_BODY = _auth_error_template("Unauthorized: Missing or invalid Authorization header", "unauthorized")
+_FORBIDDEN_BODY = _auth_error_template("Forbidden: Invalid token", "forbidden")
+
+
+def _auth_error_response(template: bytes, status: int, request: Request) -> Response:
+    body = template % _request_id().encode("ascii")
+    return add_cors_headers(Response(body=body, status=status, content_type="application/json"), request)
+
+
+# Endpoints served without a bearer token
+_PUBLIC_PATHS = frozenset({"/", "/health", "/providers"})
 
 
 @web.middleware
 async def auth_middleware(request: Request, handler: Callable[[Request], Awaitable[StreamResponse]]) -> StreamResponse:
     """Middleware to enforce token authentication."""
-    # Allow public endpoints
-    if request.path in ["/", "/health", "/providers"]:
-        return await handler(request)
-
-    # Allow CORS preflight options
+    # Answer CORS preflight here; aiohttp still runs middlewares for unmatched
+    # routes, so no catch-all OPTIONS route is needed
     if request.method == "OPTIONS":
+        return add_cors_headers(Response(status=204), request)
+
+    # Allow public endpoints
+    if request.path in _PUBLIC_PATHS:
         return await handler(request)
 
     # Check Authorization header
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
-        return add_cors_headers(
-            web.json_response(
-                {
-                    "request_id": str(uuid.uuid4()),
-                    "service": "voice",
-                    "task": "auth",
-                    "provider": None,
-                    "model": None,
-                    "usage": None,
-                    "error": {
-                        "message": "Unauthorized: Missing or invalid Authorization header",
-                        "code": "unauthorized",
-                        "retryable": False,
-                    },
-                },
-                status=401,
-            ),
-            request,
-        )
+        return _auth_error_response(_UNAUTHORIZED_BODY, 401, request)
 
-    token = auth_header.split(" ")[1]
-    if not secrets.compare_digest(token, API_TOKEN):
-        return add_cors_headers(
-            web.json_response(
-                {
-                    "request_id": str(uuid.uuid4()),
-                    "service": "voice",
-                    "task": "auth",
-                    "provider": None,
-                    "model": None,
-                    "usage": None,
-                    "error": {
-                        "message": "Forbidden: Invalid token",
-                        "code": "forbidden",
-                        "retryable": False,
-                    },
-                },
-                status=403,
-            ),
-            request,
-        )
+    token = auth_header[len("Bearer ") :]
+    if len(token) != _API_TOKEN_LEN or not secrets.compare_digest(
+        token.encode("utf-8", "surrogateescape"), _API_TOKEN_BYTES
+    ):
+        return _auth_error_response(_FORBIDDEN_BODY, 403, request)
 
     return await handler(request)
 
 
+_ResponseT = TypeVar("_ResponseT", bound=StreamResponse)
+
 # CORS headers for browser/cross-origin access
-ALLOWED_ORIGINS = get_allowed_origins()
+ALLOWED_ORIGINS = frozenset(get_allowed_origins())
 
+# Headers set on every response regardless of origin
+_BASE_CORS_HEADERS = MappingProxyType(
+    {
+        "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+        "Access-Control-Allow-Headers": "Content-Type, Authorization",
+    }
+)
 
-def add_cors_headers(response: Response, request: Optional[Request] = None) -> Response:
+
+def add_cors_headers(response: _ResponseT, request: Optional[Request] = None) -> _ResponseT:
     """Add CORS headers to response.
 
     Only sets Access-Control-Allow-Origin when:
@@ -121,26 +175,27 @@ def add_cors_headers(response: Response, request: Optional[Request] = None) -> R
     the CORS header is not set (browser will block the request).
     """
     # Always set these headers for CORS support
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-    response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
+    response.headers.update(_BASE_CORS_HEADERS)
 
     # Only set Allow-Origin if request has Origin and it's in allowed list
-    if request:
-        req_origin = request.headers.get("Origin")
-        if req_origin and ALLOWED_ORIGINS and req_origin in ALLOWED_ORIGINS:
-            response.headers["Access-Control-Allow-Origin"] = req_origin
+    req_origin = request.headers.get("Origin") if request else None
+    if req_origin and req_origin in ALLOWED_ORIGINS:
+        response.headers["Access-Control-Allow-Origin"] = req_origin
 
     return response
 
 
-def should_validate() -> bool:
-    return os.getenv("MATILDA_SCHEMA_VALIDATE", "").lower() in {"1", "true", "yes", "on"}
+# Schema validation is a debugging aid; read the switch once per process instead of per response
+SCHEMA_VALIDATION_ENABLED = os.getenv("MATILDA_SCHEMA_VALIDATE", "").lower() in {"1", "true", "yes", "on"}
+
+# /synthesize streams the base64 audio into the JSON body by default; set to 0 to
+# build the whole body in memory first
+SYNTHESIZE_STREAMING_ENABLED = os.getenv("MATILDA_VOICE_STREAM_SYNTHESIZE", "1").lower() in {"1", "true", "yes", "on"}
 
 
 def validate_response(model: Any, payload: dict[str, Any]) -> None:
-    if not should_validate():
-        return
-    model.model_validate(payload)
+    if SCHEMA_VALIDATION_ENABLED:
+        model.model_validate(payload)
 
 
 def ok_response(
@@ -153,7 +208,7 @@ def ok_response(
     usage: dict[str, Any] | None = None,
 ) -> Response:
     response_payload = {
-        "request_id": str(uuid.uuid4()),
+        "request_id": _request_id(),
         "service": "voice",
         "task": task,
         "provider": provider,
@@ -163,7 +218,39 @@ def ok_response(
     }
     if model is not None:
         validate_response(model, response_payload)
-    return add_cors_headers(web.json_response(response_payload), request)
+    return add_cors_headers(_json_response(response_payload), request)
+
+
+def _envelope_prefix(task: str) -> bytes:
+    """Encode an ok envelope with no provider/model/usage up to its "result" value.
+
+    Leaves a %s slot for the request id; "result" is the last key, so the
+    encoded null and closing brace are trimmed for the caller to replace.
+    """
+    encoded = _json_dumps(
+        {
+            "request_id": "%s",
+            "service": "voice",
+            "task": task,
+            "provider": None,
+            "model": None,
+            "usage": None,
+            "result": None,
+        }
+    )
+    return encoded[: -len(b"null}")]
+
+
+_PROVIDERS_PREFIX = _envelope_prefix("providers")
+_RELOAD_PREFIX = _envelope_prefix("reload")
+
+
+def prefixed_ok_response(prefix: bytes, payload: dict[str, Any], request: Request, model: Any) -> Response:
+    """Like ok_response for tasks that never set provider/model/usage, encoding only the result."""
+    body = prefix % _request_id().encode("ascii") + _json_dumps(payload) + b"}"
+    if SCHEMA_VALIDATION_ENABLED:
+        validate_response(model, _json_loads(body))
+    return add_cors_headers(Response(body=body, content_type="application/json"), request)
 
 
 def error_response(
@@ -174,7 +261,7 @@ def error_response(
     task: str = "unknown",
 ) -> Response:
     response_payload = {
-        "request_id": str(uuid.uuid4()),
+        "request_id": _request_id(),
         "service": "voice",
         "task": task,
         "provider": None,
@@ -183,47 +270,287 @@ def error_response(
         "error": {"message": message, "code": code, "retryable": status >= 500},
     }
     validate_response(ErrorEnvelope, response_payload)
-    return add_cors_headers(web.json_response(response_payload, status=status), request)
+    return add_cors_headers(_json_response(response_payload, status=status), request)
+
+
+# Synthesized audio only lives until it is base64-encoded, so keep it on tmpfs where
+# available. A real path (not a memfd) is needed: providers hand it to ffmpeg, which runs
+# in a child process and infers the container from the file extension.
+_SYNTHESIS_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
 
+# Stands in for the audio field while the envelope is JSON-encoded; the base64 bytes are
+# spliced in afterwards so megabytes of audio are never decoded to str or escape-scanned.
+# Random per process so request-supplied fields (e.g. provider) can't collide with it.
+_AUDIO_PLACEHOLDER = f"audio-{secrets.token_hex(16)}"
+
+
+# Chunk size: needs to be multiple of 3 so base64 doesn't pad in the middle
+# Larger chunk size (768KB) improves throughput and reduces GIL contention
+# compared to smaller chunks, while avoiding the latency spike of reading the whole file.
+# 262144 * 3 = 786432 bytes
+_READ_CHUNK_SIZE = 786432
+
+# Read buffers are reused across requests instead of allocating (and mmap'ing) a
+# fresh 768KB bytes object per chunk; LIFO so the most recently used, cache-warm
+# buffer goes out first. Capped so idle memory stays bounded.
+_READ_BUFFER_POOL: "queue.LifoQueue[bytearray]" = queue.LifoQueue(maxsize=int(os.getenv("MATILDA_VOICE_BUF_POOL", "8")))
+
+
+def _borrow_read_buffer() -> bytearray:
+    try:
+        return _READ_BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(_READ_CHUNK_SIZE)
+
+
+def _return_read_buffer(buffer: bytearray) -> None:
+    try:
+        _READ_BUFFER_POOL.put_nowait(buffer)
+    except queue.Full:
+        pass
 
-def _read_and_encode_audio(path: str) -> tuple[str, int]:
-    """Read audio file and encode as base64.
+
+def _fill_chunk(f: io.BufferedReader, view: memoryview) -> int:
+    """Read into view until it is full or the file ends; return the byte count.
+
+    Filling whole chunks keeps them multiples of 3 so only the last one can need base64 padding.
+    """
+    filled = 0
+    while filled < len(view) and (n := f.readinto(view[filled:])):
+        filled += n
+    return filled
+
+
+def _read_and_encode_chunk(path: str, offset: int) -> bytes:
+    """Read the chunk of path at offset and return it base64-encoded, or b"" at end of file.
+
+    Runs entirely in an executor thread: the file and the pooled buffer are opened, borrowed
+    and returned here, so a cancelled request never releases them while a worker still uses them.
+    """
+    buffer = _borrow_read_buffer()
+    try:
+        with memoryview(buffer) as view, open(path, "rb") as f:
+            f.seek(offset)
+            filled = _fill_chunk(f, view)
+            return binascii.b2a_base64(view[:filled], newline=False) if filled else b""
+    finally:
+        _return_read_buffer(buffer)
+
+
+def _read_and_encode_audio(path: str) -> tuple[bytearray, int]:
+    """Read audio file and encode as base64 bytes.
 
     This function is intended to be run in an executor.
     It processes the file in chunks to avoid holding the GIL for too long,
     preventing the event loop from being starved for large files.
     """
-    encoded_parts = []
+    encoded = bytearray()
     file_size = 0
+    buffer = _borrow_read_buffer()
 
-    # Chunk size: needs to be multiple of 3 so base64 doesn't pad in the middle
-    # Larger chunk size (768KB) improves throughput and reduces GIL contention
-    # compared to smaller chunks, while avoiding the latency spike of reading the whole file.
-    # 262144 * 3 = 786432 bytes
-    chunk_size = 786432
+    try:
+        with memoryview(buffer) as view, open(path, "rb") as f:
+            while filled := _fill_chunk(f, view):
+                file_size += filled
+                encoded += binascii.b2a_base64(view[:filled], newline=False)
+    finally:
+        _return_read_buffer(buffer)
 
-    with open(path, "rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            file_size += len(chunk)
-            # b64encode returns bytes, decode to str
-            encoded_chunk = base64.b64encode(chunk).decode("utf-8")
-            encoded_parts.append(encoded_chunk)
+    return encoded, file_size
 
-    return "".join(encoded_parts), file_size
 
+# "process" sends every synthesis to the worker processes, e.g. when the default
+# provider is a local model; "thread" (default) only does so for CPU_BOUND_PROVIDERS
+TTS_BACKEND = os.getenv("MATILDA_VOICE_TTS_BACKEND", "thread").lower()
 
-async def handle_options(request: Request) -> Response:
-    """Handle CORS preflight requests."""
-    return add_cors_headers(Response(status=200), request)
 
+def _provider_name(provider: Optional[str]) -> Optional[str]:
+    """Registry name for a request's provider field ("azure", "@azure" or "azure_tts")."""
+    if not provider:
+        return None
+    name = provider.lstrip("@")
+    return PROVIDER_SHORTCUTS.get(name, name)
 
-async def handle_health(request: Request) -> Response:
-    """Health check endpoint."""
+
+def _executor_for(app: web.Application, provider: Optional[str]) -> Executor:
+    """Pick the pool for a request: processes for CPU-bound providers, threads otherwise."""
+    if TTS_BACKEND == "process" or _provider_name(provider) in CPU_BOUND_PROVIDERS:
+        return cast(Executor, app["cpu_pool"])
+    return cast(Executor, app["tts_executor"])
+
+
+def _supports_native_async(provider: Optional[str]) -> bool:
+    """Whether synthesis for this provider can be awaited on the loop instead of using a pool.
+
+    The provider class is imported on first check (on the loop thread); later checks are cached.
+    """
+    name = _provider_name(provider)
+    return name is not None and bool(_hooks().get_engine().provider_supports_async(name))
+
+
+def _synthesize_to_path(
+    text: Optional[str], options: tuple[str, ...], output_path: str, voice: Optional[str], audio_format: str
+) -> None:
+    _hooks().on_save(
+        text=text,
+        options=options,
+        output=output_path,
+        voice=voice,
+        format=audio_format,
+        json=False,
+        debug=False,
+        rate=None,
+        pitch=None,
+        ssml=False,
+    )
+
+
+def _synthesize_and_encode(
+    text: Optional[str], options: tuple[str, ...], output_path: str, voice: Optional[str], audio_format: str
+) -> tuple[bytearray, int]:
+    """Synthesize to output_path and return its base64 encoding.
+
+    Runs in the executor as a single hop, so neither synthesis nor the
+    read/encode of the result touches the event loop thread.
+    """
+    _synthesize_to_path(text, options, output_path, voice, audio_format)
+    return _read_and_encode_audio(output_path)
+
+
+class _TempFileResponse(FileResponse):
+    """FileResponse that deletes its file once it has been sent."""
+
+    def __init__(self, path: str, **kwargs: Any) -> None:
+        super().__init__(path, **kwargs)
+        self._temp_path = path
+
+    async def prepare(self, request: BaseRequest) -> Optional[AbstractStreamWriter]:
+        # FileResponse sends the whole body (via sendfile where supported) inside prepare()
+        try:
+            return await super().prepare(request)
+        finally:
+            Path(self._temp_path).unlink(missing_ok=True)
+
+
+@functools.lru_cache(maxsize=64)
+def _preferred_raw_audio_type(accept: str) -> Optional[str]:
+    """Return the raw-audio media range that outranks JSON in an Accept header, if any.
+
+    Ranges are compared by q-value, then by specificity, so ``audio/*`` beats ``*/*`` but not
+    ``application/json`` at the same q. Ranges with ``q=0`` are refusals and are ignored.
+    """
+    best_raw: tuple[float, int, str] = (0.0, 0, "")
+    best_json: tuple[float, int] = (0.0, 0)
+    for media_range in accept.split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        media_type = media_type.lower()
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality <= 0:
+            continue
+        if media_type == "application/octet-stream" or media_type.startswith("audio/"):
+            specificity = 1 if media_type == "audio/*" else 2
+            best_raw = max(best_raw, (quality, specificity, media_type))
+        elif media_type in ("application/json", "application/*", "*/*"):
+            specificity = {"application/json": 2, "application/*": 1, "*/*": 0}[media_type]
+            best_json = max(best_json, (quality, specificity))
+    return best_raw[2] if best_raw[0] and best_raw[:2] > best_json else None
+
+
+def wants_raw_audio(request: Request) -> bool:
+    """Whether the client asked for raw audio (``?encoding=binary`` or an Accept preferring audio)."""
+    if request.query.get("encoding") == "binary":
+        return True
+    return _preferred_raw_audio_type(request.headers.get("Accept", "")) is not None
+
+
+def audio_file_response(path: str, audio_format: str, size_bytes: int, request: Request) -> FileResponse:
+    """Serve synthesized audio as the raw body, with the envelope's metadata moved into headers.
+
+    The file is streamed from disk rather than buffered, and removed after sending.
+    """
+    if _preferred_raw_audio_type(request.headers.get("Accept", "")) == "application/octet-stream":
+        content_type = "application/octet-stream"
+    else:
+        content_type = mimetypes.guess_type(f"audio.{audio_format}")[0] or "application/octet-stream"
+    headers = {
+        "Content-Type": content_type,
+        "Content-Disposition": f'inline; filename="speech.{audio_format}"',
+        "X-Voice-Format": audio_format,
+        "X-Voice-Size": str(size_bytes),
+        "X-Request-Id": _request_id(),
+        "Access-Control-Expose-Headers": "X-Voice-Format, X-Voice-Size, X-Request-Id",
+    }
+    return add_cors_headers(_TempFileResponse(path, headers=headers), request)
+
+
+def _synthesize_envelope(result: dict[str, Any], provider: str | None) -> tuple[bytes, bytes]:
+    """Encode the synthesize envelope around its audio field, returning the bytes before and after it."""
     response_payload = {
-        "request_id": str(uuid.uuid4()),
+        "request_id": _request_id(),
+        "service": "voice",
+        "task": "synthesize",
+        "provider": provider,
+        "model": None,
+        "usage": None,
+        "result": {"audio": _AUDIO_PLACEHOLDER, **result},
+    }
+    validate_response(SynthesizeEnvelope, response_payload)
+    head, tail = _json_dumps(response_payload).split(_AUDIO_PLACEHOLDER.encode("ascii"), 1)
+    return head, tail
+
+
+def synthesize_response(
+    result: dict[str, Any], audio_base64: bytes | bytearray, request: Request, provider: str | None = None
+) -> Response:
+    """Like ok_response for the synthesize task, with pre-encoded base64 audio spliced into the body."""
+    head, tail = _synthesize_envelope(result, provider)
+    body = b"".join([head, audio_base64, tail])
+    return add_cors_headers(Response(body=body, content_type="application/json"), request)
+
+
+async def stream_synthesize_response(
+    result: dict[str, Any], path: str, size_bytes: int, request: Request, provider: str | None = None
+) -> StreamResponse:
+    """Send the synthesize envelope with the audio at path base64-encoded chunk by chunk.
+
+    Only one read chunk is held at a time, and the client starts receiving the
+    envelope while the rest of the file is still being encoded.
+    """
+    head, tail = _synthesize_envelope(result, provider)
+    response = add_cors_headers(StreamResponse(headers={"Content-Type": "application/json"}), request)
+    response.content_length = len(head) + 4 * ((size_bytes + 2) // 3) + len(tail)
+    await response.prepare(request)
+
+    loop = asyncio.get_running_loop()
+    executor = request.app["tts_executor"]
+    try:
+        await response.write(head)
+        offset = 0
+        while encoded := await loop.run_in_executor(executor, _read_and_encode_chunk, path, offset):
+            # Every chunk but the last fills the whole read buffer
+            offset += _READ_CHUNK_SIZE
+            await response.write(encoded)
+        await response.write(tail)
+        await response.write_eof()
+    except Exception:
+        # Headers are already sent, so an error envelope is no longer possible; drop the
+        # connection and let the short body signal the failure to the client
+        logger.exception("Failed while streaming synthesize response")
+        response.force_close()
+    return response
+
+
+# Only the request id varies between health responses; encode the rest once
+_HEALTH_BODY = _json_dumps(
+    {
+        "request_id": "%s",
         "service": "voice",
         "task": "health",
         "provider": None,
@@ -231,7 +558,13 @@ async def handle_health(request: Request) -> Response:
         "usage": None,
         "result": {"status": "ok", "service": "voice"},
     }
-    return add_cors_headers(web.json_response(response_payload), request)
+)
+
+
+async def handle_health(request: Request) -> Response:
+    """Health check endpoint."""
+    body = _HEALTH_BODY % _request_id().encode("ascii")
+    return add_cors_headers(Response(body=body, content_type="application/json"), request)
 
 
 async def handle_speak(request: Request) -> Response:
@@ -260,8 +593,8 @@ async def handle_speak(request: Request) -> Response:
     }
     """
     try:
-        data = await request.json()
-    except json.JSONDecodeError:
+        data = _json_loads(await request.read())
+    except ValueError:
         return error_response("Invalid JSON", request, task="speak")
 
     text = data.get("text")
@@ -272,20 +605,21 @@ async def handle_speak(request: Request) -> Response:
     provider = data.get("provider")
 
     try:
-        # Import here to avoid circular imports
-        from .app_hooks import on_speak
+        on_speak = _hooks().on_speak
 
         # Run synthesis (this plays audio)
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         options: tuple[()] | tuple[str, str] = ()
         text_arg = text
         if provider:
             shortcut = provider if provider.startswith("@") else f"@{provider}"
             options = (shortcut, str(text))
             text_arg = None
+        # partial (not a lambda) so the call can be pickled for the process pool
         await loop.run_in_executor(
-            None,
-            lambda: on_speak(
+            _executor_for(request.app, provider),
+            functools.partial(
+                on_speak,
                 text=text_arg,
                 options=options,
                 voice=voice,
@@ -307,7 +641,7 @@ async def handle_speak(request: Request) -> Response:
         return error_response(str(e), request, status=500, code="internal_error", task="speak")
 
 
-async def handle_synthesize(request: Request) -> Response:
+async def handle_synthesize(request: Request) -> StreamResponse:
     """
     Synthesize text and return audio data (no playback).
 
@@ -334,10 +668,14 @@ async def handle_synthesize(request: Request) -> Response:
             "size_bytes": 1234
         }
     }
+
+    Clients passing ``?encoding=binary`` or sending ``Accept: application/octet-stream``
+    (or ``audio/*``) get the raw audio as the body instead, skipping base64, with
+    format/size/request id in X-Voice-Format, X-Voice-Size and X-Request-Id headers.
     """
     try:
-        data = await request.json()
-    except json.JSONDecodeError:
+        data = _json_loads(await request.read())
+    except ValueError:
         return error_response("Invalid JSON", request, task="synthesize")
 
     text = data.get("text")
@@ -349,54 +687,70 @@ async def handle_synthesize(request: Request) -> Response:
     audio_format = data.get("format", "wav")
 
     try:
-        from .app_hooks import on_save
-
         # Create temp file for audio
-        with tempfile.NamedTemporaryFile(suffix=f".{audio_format}", delete=False) as tmp:
+        with tempfile.NamedTemporaryFile(suffix=f".{audio_format}", dir=_SYNTHESIS_TMP_DIR, delete=False) as tmp:
             tmp_path = tmp.name
+        owns_tmp_file = True
 
         try:
-            # Run synthesis to file
-            loop = asyncio.get_event_loop()
-            options: tuple[()] | tuple[str, str] = ()
+            options: tuple[str, ...] = ()
             text_arg = text
             if provider:
                 shortcut = provider if provider.startswith("@") else f"@{provider}"
                 options = (shortcut, str(text))
                 text_arg = None
-            await loop.run_in_executor(
-                None,
-                lambda: on_save(
-                    text=text_arg,
-                    options=options,
-                    output=tmp_path,
-                    voice=voice,
-                    format=audio_format,
-                    json=False,
-                    debug=False,
-                    rate=None,
-                    pitch=None,
-                    ssml=False,
-                ),
-            )
-
-            # Read audio file and encode as base64
-            # Run in dedicated I/O executor to avoid blocking the event loop
-            # and to prevent contention with the default executor used for TTS synthesis
-            audio_base64, size_bytes = await loop.run_in_executor(IO_EXECUTOR, _read_and_encode_audio, tmp_path)
+            loop = asyncio.get_running_loop()
+            native_async = _supports_native_async(provider)
+            if native_async:
+                await _hooks().on_save_async(text_arg, options, tmp_path, audio_format, voice)
+
+            if wants_raw_audio(request) or SYNTHESIZE_STREAMING_ENABLED:
+                if not native_async:
+                    await loop.run_in_executor(
+                        _executor_for(request.app, provider),
+                        _synthesize_to_path,
+                        text_arg,
+                        options,
+                        tmp_path,
+                        voice,
+                        audio_format,
+                    )
+                size_bytes = os.path.getsize(tmp_path)
+
+                if wants_raw_audio(request):
+                    # The response now owns the file and deletes it once sent
+                    owns_tmp_file = False
+                    return audio_file_response(tmp_path, audio_format, size_bytes, request)
+
+                result = {"format": audio_format, "text": text, "size_bytes": size_bytes}
+                return await stream_synthesize_response(result, tmp_path, size_bytes, request, provider=provider)
+
+            if native_async:
+                audio_base64, size_bytes = await loop.run_in_executor(
+                    request.app["tts_executor"], _read_and_encode_audio, tmp_path
+                )
+            else:
+                audio_base64, size_bytes = await loop.run_in_executor(
+                    _executor_for(request.app, provider),
+                    _synthesize_and_encode,
+                    text_arg,
+                    options,
+                    tmp_path,
+                    voice,
+                    audio_format,
+                )
 
             result = {
-                "audio": audio_base64,
                 "format": audio_format,
                 "text": text,
                 "size_bytes": size_bytes,
             }
-            return ok_response("synthesize", result, request, SynthesizeEnvelope, provider=provider)
+            return synthesize_response(result, audio_base64, request, provider=provider)
 
         finally:
             # Clean up temp file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            if owns_tmp_file:
+                Path(tmp_path).unlink(missing_ok=True)
 
     except Exception as e:
         logger.exception("Failed to handle synthesize request")
@@ -423,10 +777,8 @@ async def handle_providers(request: Request) -> Response:
     }
     """
     try:
-        from .app_hooks import PROVIDERS_REGISTRY
-
-        providers = list(PROVIDERS_REGISTRY.keys())
-        return ok_response("providers", {"providers": providers}, request, ProvidersEnvelope)
+        providers = list(_hooks().PROVIDERS_REGISTRY.keys())
+        return prefixed_ok_response(_PROVIDERS_PREFIX, {"providers": providers}, request, ProvidersEnvelope)
 
     except Exception as e:
         logger.exception("Failed to list providers")
@@ -451,36 +803,126 @@ async def handle_reload(request: Request) -> Response:
     }
     """
     try:
-        from .internal.config import reload_config
-
         # Clear configuration cache
         reload_config()
 
         logger.info("Configuration reloaded via API")
-        return ok_response("reload", {"message": "Configuration reloaded"}, request, ReloadEnvelope)
+        return prefixed_ok_response(_RELOAD_PREFIX, {"message": "Configuration reloaded"}, request, ReloadEnvelope)
     except Exception as e:
         logger.exception("Error reloading configuration")
         return error_response(str(e), request, status=500, code="internal_error", task="reload")
 
 
-def create_app() -> web.Application:
-    """Create the aiohttp application."""
+ROUTES = (
+    web.get("/health", handle_health),
+    web.get("/", handle_health),
+    web.post("/speak", handle_speak),
+    web.post("/synthesize", handle_synthesize),
+    web.post("/reload", handle_reload),
+)
+
+
+def _init_cpu_worker() -> None:
+    """Process pool initializer: pay the hook and provider imports at spawn, not on the first request."""
+    engine = _hooks().get_engine()
+    for name in CPU_BOUND_PROVIDERS:
+        # Local model providers are optional extras; skip any that are not installed
+        with contextlib.suppress(ProviderLoadError):
+            engine.load_provider(name)
+
+
+def _create_executors() -> tuple[ThreadPoolExecutor, ProcessPoolExecutor]:
+    """Create the synthesis pools; neither starts workers until first used."""
+    # Synthesis is CPU/subprocess heavy; bound it so a burst of requests cannot spawn
+    # more concurrent provider runs than the host can handle
+    workers = int(os.getenv("MATILDA_VOICE_WORKERS", "4"))
+    tts_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts")
+    # Local model providers hold the GIL for much of synthesis, so threads would serialize
+    # them; they get worker processes instead. Each worker loads its own copy of the model,
+    # hence the small default. Spawned (not forked) since the server is multi-threaded.
+    cpu_workers = int(os.getenv("MATILDA_VOICE_CPU_WORKERS", str(min(4, os.cpu_count() or 1))))
+    cpu_pool = ProcessPoolExecutor(
+        max_workers=cpu_workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_cpu_worker
+    )
+    return tts_executor, cpu_pool
+
+
+def _shutdown_executors(tts_executor: ThreadPoolExecutor, cpu_pool: ProcessPoolExecutor) -> None:
+    tts_executor.shutdown(wait=False, cancel_futures=True)
+    cpu_pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _close_async_providers(app: web.Application) -> None:
+    # Providers awaited natively by /synthesize keep pooled clients per event loop; if the
+    # hooks were never loaded no provider was created, so don't import them just to exit
+    if _hooks.cache_info().currsize:
+        await _hooks().get_engine().aclose_async_providers()
+
+
+def create_app(executors: Optional[tuple[ThreadPoolExecutor, ProcessPoolExecutor]] = None) -> web.Application:
+    """Create the aiohttp application.
+
+    Args:
+        executors: (thread pool, process pool) to share with other apps; by default
+            the app creates its own and shuts them down on cleanup.
+    """
     app = web.Application(middlewares=[auth_middleware])
+    app.on_cleanup.append(_close_async_providers)
 
-    # Routes
-    app.router.add_route("OPTIONS", "/{path:.*}", handle_options)
-    app.router.add_get("/health", handle_health)
-    app.router.add_get("/", handle_health)
-    app.router.add_post("/speak", handle_speak)
-    app.router.add_post("/synthesize", handle_synthesize)
-    app.router.add_post("/reload", handle_reload)
+    if executors is None:
+        executors = _create_executors()
+
+        async def shutdown_executors(app: web.Application) -> None:
+            _shutdown_executors(app["tts_executor"], app["cpu_pool"])
+
+        app.on_cleanup.append(shutdown_executors)
+
+    app["tts_executor"], app["cpu_pool"] = executors
+
+    app.add_routes(ROUTES)
 
     return app
 
 
+def _event_loop_count() -> int:
+    """How many event loops to serve TCP from: one per core on free-threaded builds, else one."""
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    if gil_enabled:
+        # Extra loops would just take turns on the GIL
+        return 1
+    return int(os.getenv("MATILDA_VOICE_EVENT_LOOPS", str(os.cpu_count() or 1)))
+
+
+def _run_event_loops(host: str, port: int, count: int) -> None:
+    """Serve from `count` threads, each with its own event loop and app on a SO_REUSEPORT socket.
+
+    The apps share one pair of synthesis pools so the worker limits stay process-wide.
+    """
+    executors = _create_executors()
+
+    def serve() -> None:
+        async def run() -> None:
+            runner = web.AppRunner(create_app(executors))
+            await runner.setup()
+            await web.TCPSite(runner, host, port, reuse_port=True).start()
+            await asyncio.Event().wait()
+
+        asyncio.run(run())
+
+    threads = [threading.Thread(target=serve, name=f"voice-loop-{i}", daemon=True) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _shutdown_executors(*executors)
+
+
 def run_server(host: str = "0.0.0.0", port: int = 8771) -> None:
     """Run the HTTP server."""
-    app = create_app()
     transport = resolve_transport("MATILDA_VOICE_TRANSPORT", "MATILDA_VOICE_ENDPOINT", host, port)
 
     print(f"Starting Voice server on http://{host}:{port}")
@@ -492,13 +934,13 @@ def run_server(host: str = "0.0.0.0", port: int = 8771) -> None:
 
     if transport.transport == "unix" and transport.endpoint:
         prepare_unix_socket(transport.endpoint)
-        web.run_app(app, path=transport.endpoint, print=None)
+        web.run_app(create_app(), path=transport.endpoint, print=None)
         return
     if transport.transport == "pipe":
         ensure_pipe_supported(transport)
 
         async def run_pipe() -> None:
-            runner = web.AppRunner(app)
+            runner = web.AppRunner(create_app())
             await runner.setup()
             site = web.NamedPipeSite(runner, transport.endpoint)
             await site.start()
@@ -507,7 +949,14 @@ def run_server(host: str = "0.0.0.0", port: int = 8771) -> None:
         asyncio.run(run_pipe())
         return
 
-    web.run_app(app, host=transport.host, port=transport.port, print=None)
+    # Each event loop builds its own app (sharing one set of executors), so only the
+    # single-loop path creates one here
+    loops = _event_loop_count()
+    if loops > 1:
+        _run_event_loops(transport.host, transport.port, loops)
+        return
+
+    web.run_app(create_app(), host=transport.host, port=transport.port, print=None)
 
 
 def main() -> None:
@@ -6,5 +6,8 @@ def is_ssml(text: str) -> bool:
     return text.startswith("<speak") and text.endswith("</speak>")
 
 
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
 def strip_ssml_tags(text: str) -> str:
-    return re.sub(r"<[^>]+>", "", text)
+    return _TAG_RE.sub("", text)
@@ -77,11 +77,14 @@ class VoiceBrowser:
         # Voice data
         self.all_voices: List[Tuple[str, str, int, str, str]] = []
         self.voice_cache: Dict[str, Tuple[int, str, str]] = {}
+        # Lowercased searchable fields per voice, built once instead of on every keystroke
+        self.search_fields: Dict[str, Tuple[str, ...]] = {}
 
     def load_voices(self) -> None:
         """Load all available voices from providers."""
         self.all_voices = []
         self.voice_cache = {}
+        self.search_fields = {}
 
         for provider_name in self.providers_registry.keys():
             try:
@@ -94,6 +97,12 @@ class VoiceBrowser:
                         quality, region, gender = analyze_voice(provider_name, voice)
                         self.all_voices.append((provider_name, voice, quality, region, gender))
                         self.voice_cache[f"{provider_name}:{voice}"] = (quality, region, gender)
+                        self.search_fields[f"{provider_name}:{voice}"] = (
+                            voice.lower(),
+                            provider_name.lower(),
+                            region.lower(),
+                            gender.lower(),
+                        )
             except (ProviderNotFoundError, ProviderLoadError, DependencyError, AuthenticationError):
                 continue
             except (ImportError, AttributeError, RuntimeError) as e:
@@ -103,6 +112,7 @@ class VoiceBrowser:
     def filter_voices(self) -> List[Tuple[str, str, int, str, str]]:
         """Apply current filters to voice list."""
         filtered = []
+        search_lower = self.search_text.lower()
         for provider, voice, quality, region, gender in self.all_voices:
             # Provider filter
             if not self.filters["providers"].get(provider, False):
@@ -117,14 +127,8 @@ class VoiceBrowser:
                 continue
 
             # Search filter
-            if self.search_text:
-                search_lower = self.search_text.lower()
-                if not (
-                    search_lower in voice.lower()
-                    or search_lower in provider.lower()
-                    or search_lower in region.lower()
-                    or search_lower in gender.lower()
-                ):
+            if search_lower:
+                if not any(search_lower in field for field in self.search_fields[f"{provider}:{voice}"]):
                     continue
 
             filtered.append((provider, voice, quality, region, gender))
@@ -9,17 +9,28 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../s
 
 from matilda_voice.internal.audio_utils import get_audio_duration, get_audio_duration_async
 
+TICK_INTERVAL = 0.1
 
-async def ticker():
-    """Prints a tick every 0.1s to show loop activity."""
+
+async def ticker(delays):
+    """Record how late each 0.1s wakeup fires; a blocked loop shows up as a large delay."""
+    loop = asyncio.get_running_loop()
     try:
         while True:
-            await asyncio.sleep(0.1)
-            print(".", end="", flush=True)
+            expected = loop.time() + TICK_INTERVAL
+            await asyncio.sleep(TICK_INTERVAL)
+            delays.append(loop.time() - expected)
     except asyncio.CancelledError:
         pass
 
 
+def report_delays(delays):
+    if delays:
+        print(f"Worst loop blocking delta: {max(delays) * 1000:.2f}ms over {len(delays)} ticks")
+    else:
+        print("Worst loop blocking delta: n/a (finished before the first tick)")
+
+
 async def run_benchmark():
     test_file = "benchmark_test.wav"
 
@@ -34,7 +45,8 @@ async def run_benchmark():
 
     # 1. Test get_audio_duration (now Async) with WAV optimization
     print("\nTesting get_audio_duration (Async) (should be instant and yield 10.0):")
-    ticker_task = asyncio.create_task(ticker())
+    delays = []
+    ticker_task = asyncio.create_task(ticker(delays))
 
     start_time = time.time()
 
@@ -50,10 +62,12 @@ async def run_benchmark():
     ticker_task.cancel()
     await asyncio.sleep(0.1)
     print(f"\nget_audio_duration calls (100x) took {total_time:.4f}s (Avg: {total_time/100*1000:.4f}ms)")
+    report_delays(delays)
 
     # 2. Test get_audio_duration_async (Alias) with WAV optimization
     print("\nTesting get_audio_duration_async (Alias) (should be instant and yield 10.0):")
-    ticker_task = asyncio.create_task(ticker())
+    delays = []
+    ticker_task = asyncio.create_task(ticker(delays))
 
     start_time = time.time()
 
@@ -68,6 +82,7 @@ async def run_benchmark():
     ticker_task.cancel()
     await asyncio.sleep(0.1)
     print(f"\nAlias calls (100x) took {total_time:.4f}s (Avg: {total_time/100*1000:.4f}ms)")
+    report_delays(delays)
 
     # Clean up
     if os.path.exists(test_file):
@@ -0,0 +1,188 @@
+import asyncio
+import contextlib
+import json
+import os
+import time
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from matilda_voice.exceptions import AuthenticationError
+from matilda_voice.internal.config import reload_config
+from matilda_voice.providers.azure_tts import AzureTTSProvider, _get_voice_cache_path, _write_chunks
+
+ENDPOINT = "https://westus.tts.speech.microsoft.com"
+
+
+@pytest.fixture
+def azure_provider(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("AZURE_API_KEY", "test-key")
+    monkeypatch.setenv("AZURE_ENDPOINT", ENDPOINT)
+    monkeypatch.setattr("matilda_voice.providers.azure_tts.get_setting", lambda key, default=None: default)
+    # Credentials are cached per config epoch; start each test from a fresh one
+    reload_config()
+    return AzureTTSProvider()
+
+
+def test_credentials_are_cached_until_config_reload(azure_provider, monkeypatch):
+    assert azure_provider._get_endpoint_optional() == ENDPOINT
+
+    monkeypatch.delenv("AZURE_ENDPOINT")
+    monkeypatch.setenv("AZURE_REGION", "eastus")
+    assert azure_provider._get_endpoint_optional() == ENDPOINT
+
+    reload_config()
+    assert azure_provider._get_endpoint_optional() == "https://eastus.tts.speech.microsoft.com"
+    assert azure_provider._get_api_key_optional() == "test-key"
+
+
+def test_voice_list_is_persisted_to_disk(azure_provider):
+    response = Mock(status_code=200)
+    response.content = json.dumps([{"ShortName": "en-US-JennyNeural"}, {"ShortName": "en-GB-LibbyNeural"}]).encode()
+
+    with patch("matilda_voice.providers.azure_tts.request_with_retry", return_value=response) as mock_request:
+        assert azure_provider._get_all_voices() == ["en-US-JennyNeural", "en-GB-LibbyNeural"]
+        mock_request.assert_called_once()
+
+    # A fresh provider (new CLI invocation) reads the disk cache instead of the network
+    with patch("matilda_voice.providers.azure_tts.request_with_retry") as mock_request:
+        assert AzureTTSProvider()._get_all_voices() == ["en-US-JennyNeural", "en-GB-LibbyNeural"]
+        mock_request.assert_not_called()
+
+
+def test_expired_voice_cache_is_refetched(azure_provider):
+    cache_path = _get_voice_cache_path(ENDPOINT)
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(json.dumps(["en-US-OldNeural"]))
+    stale = time.time() - 2 * 86400
+    os.utime(cache_path, (stale, stale))
+
+    response = Mock(status_code=200)
+    response.content = json.dumps([{"ShortName": "en-US-NewNeural"}]).encode()
+
+    with patch("matilda_voice.providers.azure_tts.request_with_retry", return_value=response):
+        assert azure_provider._get_all_voices() == ["en-US-NewNeural"]
+
+    assert json.loads(cache_path.read_text()) == ["en-US-NewNeural"]
+
+
+def test_voice_cache_is_keyed_by_endpoint(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert _get_voice_cache_path(ENDPOINT) != _get_voice_cache_path("https://eastus.tts.speech.microsoft.com")
+
+
+def test_synthesize_streams_audio_to_file(azure_provider, tmp_path):
+    response = Mock(status_code=200)
+    response.iter_bytes.return_value = iter([b"ID3", b"audio"])
+    output_path = tmp_path / "out.mp3"
+
+    with patch(
+        "matilda_voice.providers.azure_tts.stream_with_retry", return_value=contextlib.nullcontext(response)
+    ) as mock_stream:
+        azure_provider.synthesize("Hello", str(output_path), output_format="mp3")
+
+    assert output_path.read_bytes() == b"ID3audio"
+    assert mock_stream.call_args.args[0] == "POST"
+    response.read.assert_not_called()
+
+
+def test_synthesize_error_leaves_no_output_file(azure_provider, tmp_path):
+    response = Mock(status_code=401, text="bad key")
+    output_path = tmp_path / "out.mp3"
+
+    with patch("matilda_voice.providers.azure_tts.stream_with_retry", return_value=contextlib.nullcontext(response)):
+        with pytest.raises(AuthenticationError):
+            azure_provider.synthesize("Hello", str(output_path), output_format="mp3")
+
+    assert not output_path.exists()
+
+
+def test_prepare_ssml_adds_voice_and_prosody_to_existing_ssml(azure_provider):
+    ssml = '<speak version="1.0"><p>Hi</p></speak>'
+
+    assert azure_provider._prepare_ssml(ssml, "en-US-JennyNeural", "+10%", None) == (
+        '<speak version="1.0"><voice name="en-US-JennyNeural"><prosody rate="+10%"><p>Hi</p></prosody></voice></speak>'
+    )
+
+
+def test_prepare_ssml_keeps_caller_voice_tag(azure_provider):
+    ssml = '<speak><voice name="en-GB-LibbyNeural">Hi</voice></speak>'
+
+    assert azure_provider._prepare_ssml(ssml, "en-US-JennyNeural", None, "high") == (
+        '<speak><voice name="en-GB-LibbyNeural"><prosody pitch="high">Hi</prosody></voice></speak>'
+    )
+
+
+def test_prepare_ssml_escapes_plain_text(azure_provider):
+    assert azure_provider._prepare_ssml("Fish & <chips>", "en-GB-LibbyNeural", None, None) == (
+        '<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="en-GB">'
+        '<voice name="en-GB-LibbyNeural">Fish &amp; &lt;chips&gt;</voice></speak>'
+    )
+
+
+def test_requests_reuse_pooled_client(azure_provider, tmp_path):
+    response = Mock(status_code=200)
+    response.iter_bytes.side_effect = lambda chunk_size: iter([b"audio"])
+
+    with patch(
+        "matilda_voice.providers.azure_tts.stream_with_retry",
+        side_effect=lambda *a, **kw: contextlib.nullcontext(response),
+    ) as mock_stream:
+        azure_provider.synthesize("One", str(tmp_path / "one.mp3"), output_format="mp3")
+        azure_provider.synthesize("Two", str(tmp_path / "two.mp3"), output_format="mp3")
+
+    first, second = (c.kwargs["client"] for c in mock_stream.call_args_list)
+    assert first is second is azure_provider._get_client()
+
+    azure_provider.close()
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+async def test_asynthesize_downloads_natively_and_writes_off_loop(azure_provider, tmp_path):
+    def handler(request):
+        assert request.headers["X-Microsoft-OutputFormat"] == "riff-16khz-16bit-mono-pcm"
+        return httpx.Response(200, content=b"RIFFdata")
+
+    azure_provider._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    output_path = tmp_path / "out.wav"
+
+    with (
+        patch.object(azure_provider, "_synthesize_to_file") as mock_sync,
+        patch("asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread,
+    ):
+        await azure_provider.asynthesize("Hello", str(output_path), output_format="wav")
+
+    mock_sync.assert_not_called()
+    mock_to_thread.assert_called_once_with(_write_chunks, str(output_path), [b"RIFFdata"])
+    assert output_path.read_bytes() == b"RIFFdata"
+
+    async_client = azure_provider._async_client
+    await azure_provider.aclose()
+    assert async_client.is_closed
+    assert azure_provider._async_client is None
+
+
+@pytest.mark.asyncio
+async def test_asynthesize_maps_http_errors(azure_provider, tmp_path):
+    azure_provider._async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(401, text="bad key"))
+    )
+
+    with pytest.raises(AuthenticationError):
+        await azure_provider.asynthesize("Hello", str(tmp_path / "out.mp3"), output_format="mp3")
+
+    await azure_provider.aclose()
+    assert not (tmp_path / "out.mp3").exists()
+
+
+def test_get_info_is_json_serializable(azure_provider):
+    azure_provider._voices_cache = ["en-US-JennyNeural"]
+
+    info = azure_provider.get_info()
+
+    assert type(info["voice_descriptions"]) is dict
+    json.dumps(info)
@@ -1,6 +1,5 @@
 """Tests for the SystemTTSProvider class."""
 
-import subprocess
 from unittest.mock import MagicMock, call, patch
 
 import pytest
@@ -22,45 +21,31 @@ class TestSystemTTSProviderDetection:
         assert provider.available_engines == ["espeak", "festival"]
 
     def test_detect_espeak_available(self):
-        with patch("subprocess.run") as mock_run:
-
-            def side_effect(cmd, **kwargs):
-                if cmd[0] == "espeak":
-                    return MagicMock(returncode=0)
-                raise subprocess.CalledProcessError(1, cmd)
-
-            mock_run.side_effect = side_effect
+        with patch("shutil.which") as mock_which:
+            mock_which.side_effect = lambda name: "/usr/bin/espeak" if name == "espeak" else None
 
             provider = SystemTTSProvider()
             assert provider.available_engines == ["espeak"]
 
     def test_detect_no_engines_available(self):
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(1, "cmd")
-
+        with patch("shutil.which", return_value=None):
             provider = SystemTTSProvider()
             assert provider.available_engines == []
 
-    def test_detect_handles_file_not_found(self):
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError("Command not found")
+    def test_detect_does_not_spawn_processes(self):
+        with patch("shutil.which", return_value=None), patch("subprocess.run") as mock_run:
+            SystemTTSProvider()
 
-            provider = SystemTTSProvider()
-            assert provider.available_engines == []
+        mock_run.assert_not_called()
 
     def test_detect_multiple_engines_available(self):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
+        with patch("shutil.which") as mock_which:
+            mock_which.side_effect = lambda name: f"/usr/bin/{name}"
 
             provider = SystemTTSProvider()
-            assert set(provider.available_engines) == {"espeak", "festival", "say"}
+            assert provider.available_engines == ["espeak", "festival", "say"]
 
-            expected_calls = [
-                call(["espeak", "--version"], capture_output=True, check=True),
-                call(["festival", "--version"], capture_output=True, check=True),
-                call(["say", "-v", "?"], capture_output=True, check=True),
-            ]
-            mock_run.assert_has_calls(expected_calls, any_order=True)
+            mock_which.assert_has_calls([call("espeak"), call("festival"), call("say")])
 
 
 class TestSystemTTSProviderSynthesize:
@@ -102,6 +87,16 @@ class TestSystemTTSProviderSynthesize:
 
             mock_run.assert_called_once_with(["say", "-r", "160", "Normal speech"], capture_output=True)
 
+    def test_synthesize_stream_say_soft_uses_emotion_voice(self):
+        provider = make_provider(["say"])
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+
+            provider.synthesize("Quiet", None, stream=True, emotion="soft")
+
+            mock_run.assert_called_once_with(["say", "-v", "Whisper", "-r", "120", "Quiet"], capture_output=True)
+
     def test_synthesize_output_espeak_wav(self):
         provider = make_provider(["espeak"])
 
@@ -114,6 +109,31 @@ class TestSystemTTSProviderSynthesize:
                 ["espeak", "-p", "50", "-s", "160", "-w", "output.wav", "File output"], capture_output=True
             )
 
+    def test_synthesize_output_espeak_mp3_pipes_into_ffmpeg(self):
+        provider = make_provider(["espeak"])
+        espeak, ffmpeg = MagicMock(), MagicMock()
+        espeak.wait.return_value = 0
+        ffmpeg.wait.return_value = 0
+
+        with patch("subprocess.Popen", side_effect=[espeak, ffmpeg]) as mock_popen:
+            provider.synthesize("File output", "output.mp3", stream=False, output_format="mp3")
+
+        espeak_call, ffmpeg_call = mock_popen.call_args_list
+        assert espeak_call.args[0] == ["espeak", "-p", "50", "-s", "160", "--stdout", "File output"]
+        assert ffmpeg_call.args[0] == ["ffmpeg", "-f", "wav", "-i", "pipe:0", "-y", "output.mp3"]
+        assert ffmpeg_call.kwargs["stdin"] is espeak.stdout
+        espeak.stdout.close.assert_called_once()
+
+    def test_synthesize_output_espeak_mp3_failure_raises(self):
+        provider = make_provider(["espeak"])
+        espeak, ffmpeg = MagicMock(), MagicMock()
+        espeak.wait.return_value = 1
+        ffmpeg.wait.return_value = 1
+
+        with patch("subprocess.Popen", side_effect=[espeak, ffmpeg]):
+            with pytest.raises(ProviderError, match="espeak synthesis failed"):
+                provider.synthesize("File output", "output.mp3", stream=False, output_format="mp3")
+
     def test_synthesize_output_say(self):
         provider = make_provider(["say"])
 
@@ -13,7 +13,10 @@ import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from matilda_voice.internal.audio_utils import cleanup_file
+import pytest
+
+from matilda_voice.exceptions import DependencyError, ProviderError
+from matilda_voice.internal.audio_utils import cleanup_file, convert_audio_stream
 
 
 class TestCleanupFile:
@@ -385,3 +388,44 @@ class TestErrorScenarios:
             # Final cleanup (should be no-op if already cleaned)
             for temp_file in temp_files:
                 cleanup_file(temp_file)
+
+
+class TestConvertAudioStream:
+    """Test piping streamed audio into ffmpeg."""
+
+    def test_chunks_are_piped_to_ffmpeg_stdin(self):
+        process = Mock()
+        process.wait.return_value = 0
+
+        with patch("subprocess.Popen", return_value=process) as mock_popen:
+            convert_audio_stream(iter([b"ID3", b"data"]), "out.ogg", "mp3")
+
+        assert mock_popen.call_args.args[0] == ["ffmpeg", "-f", "mp3", "-i", "pipe:0", "-y", "out.ogg"]
+        assert [c.args[0] for c in process.stdin.write.call_args_list] == [b"ID3", b"data"]
+        process.stdin.close.assert_called_once()
+
+    def test_ffmpeg_failure_raises_provider_error(self):
+        process = Mock()
+        process.wait.return_value = 1
+
+        with patch("subprocess.Popen", return_value=process):
+            with pytest.raises(ProviderError, match="Audio conversion failed"):
+                convert_audio_stream(iter([b"data"]), "out.ogg", "mp3")
+
+    def test_missing_ffmpeg_raises_dependency_error(self):
+        with patch("subprocess.Popen", side_effect=FileNotFoundError):
+            with pytest.raises(DependencyError):
+                convert_audio_stream(iter([b"data"]), "out.ogg", "mp3")
+
+    def test_source_error_stops_ffmpeg(self):
+        process = Mock()
+
+        def chunks():
+            yield b"data"
+            raise OSError("connection reset")
+
+        with patch("subprocess.Popen", return_value=process):
+            with pytest.raises(OSError):
+                convert_audio_stream(chunks(), "out.ogg", "mp3")
+
+        process.kill.assert_called_once()
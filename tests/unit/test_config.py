@@ -8,11 +8,18 @@ external dependencies or mocks. They test core business logic for:
 - SSML detection and processing
 """
 
+import tomllib
+
 from matilda_voice.internal.config import (
     CONFIG_DEFAULTS,
+    DEFAULT_CONFIG,
     _parse_env_value,
+    get_config_path,
     get_config_value,
+    load_config,
     parse_voice_setting,
+    reload_config,
+    save_config,
     validate_api_key,
 )
 from matilda_voice.speech_synthesis.ssml.utils import is_ssml, strip_ssml_tags
@@ -414,3 +421,84 @@ class TestConfigDefaults:
     def test_get_config_value_unknown_key(self):
         """Test getting unknown configuration key returns None."""
         assert get_config_value("completely_unknown_key_12345") is None
+
+    def test_env_override_applies_typed_value(self, monkeypatch):
+        """Test TTS_<KEY> environment overrides are coerced to the default's type."""
+        monkeypatch.setenv("TTS_CHATTERBOX_SERVER_PORT", "23456")
+        monkeypatch.setenv("TTS_NOT_A_REAL_KEY", "ignored")
+        reload_config()
+        try:
+            assert get_config_value("chatterbox_server_port") == 23456
+            assert get_config_value("not_a_real_key") is None
+        finally:
+            monkeypatch.undo()
+            reload_config()
+
+
+class TestLoadConfigCache:
+    """Test caching of the parsed TOML config file."""
+
+    def test_config_path_follows_home_changes(self, tmp_path, monkeypatch):
+        """Test the cached config path is re-resolved when HOME changes."""
+        monkeypatch.delenv("MATILDA_CONFIG", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path / "first"))
+        assert get_config_path() == tmp_path / "first" / ".matilda" / "config.toml"
+
+        monkeypatch.setenv("HOME", str(tmp_path / "second"))
+        assert get_config_path() == tmp_path / "second" / ".matilda" / "config.toml"
+
+        monkeypatch.setenv("MATILDA_CONFIG", str(tmp_path / "custom.toml"))
+        assert get_config_path() == tmp_path / "custom.toml"
+
+    def test_cached_config_is_copied_and_refreshed(self, tmp_path, monkeypatch):
+        """Test callers get independent copies and file edits are picked up."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[voice]\nrate = "+10%"\n')
+        monkeypatch.setattr("matilda_voice.internal.config.get_config_path", lambda: config_file)
+        reload_config()
+
+        first = load_config()
+        assert first["rate"] == "+10%"
+        first["rate"] = "mutated"
+        assert load_config()["rate"] == "+10%"
+
+        config_file.write_text('[voice]\nrate = "+20%"\npitch = "+5Hz"\n')
+        assert load_config()["rate"] == "+20%"
+        reload_config()
+
+    def test_cached_config_nested_tables_are_copied(self, tmp_path, monkeypatch):
+        """Test mutating a nested table does not leak into the cache or defaults."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[voice]\nrate = "+10%"\n\n[voice.providers]\ncustom = "kept"\n')
+        monkeypatch.setattr("matilda_voice.internal.config.get_config_path", lambda: config_file)
+        reload_config()
+
+        first = load_config()
+        for value in first.values():
+            if isinstance(value, dict):
+                value["injected"] = True
+
+        second = load_config()
+        assert second["providers"]["custom"] == "kept"
+        assert all("injected" not in value for value in second.values() if isinstance(value, dict))
+        assert all("injected" not in value for value in DEFAULT_CONFIG.values() if isinstance(value, dict))
+        reload_config()
+
+    def test_save_config_preserves_other_sections(self, tmp_path, monkeypatch):
+        """Test saving the voice section keeps sections owned by other tools."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[voice]\nrate = "+10%"\n\n[other]\nkey = "kept"\n')
+        monkeypatch.setattr("matilda_voice.internal.config.get_config_path", lambda: config_file)
+        reload_config()
+
+        config = load_config()
+        config["rate"] = "+30%"
+        assert save_config(config) is True
+        config["rate"] = "+40%"
+        assert save_config(config) is True
+
+        saved = tomllib.loads(config_file.read_text())
+        assert saved["other"] == {"key": "kept"}
+        assert saved["voice"]["rate"] == "+40%"
+        assert load_config()["rate"] == "+40%"
+        reload_config()
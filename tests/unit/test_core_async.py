@@ -0,0 +1,98 @@
+"""Tests for TTSEngine.asynthesize_text."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from matilda_voice.base import TTSProvider
+from matilda_voice.core import TTSEngine
+from matilda_voice.exceptions import TTSError
+from matilda_voice.hooks.core import on_save, on_save_async
+
+
+class FakeAsyncProvider(TTSProvider):
+    native_async = True
+    instances = 0
+
+    def __init__(self):
+        type(self).instances += 1
+        self.calls = []
+        self.closed = False
+
+    def synthesize(self, text, output_path, **kwargs):
+        raise AssertionError("sync path should not be used")
+
+    async def asynthesize(self, text, output_path, **kwargs):
+        self.calls.append((text, kwargs))
+        with open(output_path, "wb") as f:
+            f.write(b"audio")
+
+    async def aclose(self):
+        self.closed = True
+
+
+PROVIDER_CLASS = FakeAsyncProvider
+
+
+@pytest.fixture
+def engine():
+    FakeAsyncProvider.instances = 0
+    return TTSEngine({"fake": __name__})
+
+
+def test_provider_supports_async(engine):
+    assert engine.provider_supports_async("fake") is True
+    assert engine.provider_supports_async("missing") is False
+
+
+def test_asynthesize_text_reuses_provider_within_loop(engine, tmp_path):
+    async def run():
+        for name in ("one.wav", "two.wav"):
+            await engine.asynthesize_text("Hello", str(tmp_path / name), provider_name="fake", voice="fake:v1")
+        return engine._async_providers[asyncio.get_running_loop()]["fake"]
+
+    provider = asyncio.run(run())
+
+    assert FakeAsyncProvider.instances == 1
+    assert len(provider.calls) == 2
+    assert provider.calls[0] == ("Hello", {"stream": False, "output_format": "wav", "voice": "v1"})
+    assert (tmp_path / "two.wav").read_bytes() == b"audio"
+
+
+def test_asynthesize_text_uses_separate_provider_per_loop(engine, tmp_path):
+    for _ in range(2):
+        asyncio.run(engine.asynthesize_text("Hi", str(tmp_path / "out.wav"), provider_name="fake"))
+
+    assert FakeAsyncProvider.instances == 2
+
+
+def test_aclose_async_providers_closes_current_loop_providers(engine, tmp_path):
+    async def run():
+        await engine.asynthesize_text("Hi", str(tmp_path / "out.wav"), provider_name="fake")
+        provider = engine._async_providers[asyncio.get_running_loop()]["fake"]
+        await engine.aclose_async_providers()
+        return provider, asyncio.get_running_loop() in engine._async_providers
+
+    provider, still_cached = asyncio.run(run())
+
+    assert provider.closed is True
+    assert still_cached is False
+
+
+def test_asynthesize_text_unknown_provider_raises(engine, tmp_path):
+    with pytest.raises(TTSError, match="unavailable"):
+        asyncio.run(engine.asynthesize_text("Hi", str(tmp_path / "out.wav"), provider_name="missing"))
+
+
+def test_on_save_async_matches_on_save_engine_call(tmp_path):
+    engine = MagicMock()
+    engine.synthesize_text.return_value = str(tmp_path / "out.mp3")
+    engine.asynthesize_text = AsyncMock(return_value=str(tmp_path / "out.mp3"))
+    args = ("@azure", ("Hello", "there"), str(tmp_path / "out.mp3"), "mp3", "en-US-JennyNeural")
+
+    with patch("matilda_voice.hooks.core.get_engine", return_value=engine):
+        on_save(*args, json=False, debug=False, rate="+10%", pitch=None)
+        asyncio.run(on_save_async(*args, rate="+10%"))
+
+    assert engine.asynthesize_text.call_args == engine.synthesize_text.call_args
@@ -0,0 +1,125 @@
+"""Tests for streaming retry behaviour in http_retry."""
+
+import httpx
+import pytest
+
+from matilda_voice.exceptions import NetworkError
+from matilda_voice.internal.http_retry import astream_with_retry, stream_with_retry
+
+
+class InterruptedStream(httpx.SyncByteStream):
+    def __iter__(self):
+        yield b"partial"
+        raise httpx.ReadError("connection dropped")
+
+
+def test_mid_stream_error_is_not_retried():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, stream=InterruptedStream())
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    received = []
+
+    with pytest.raises(NetworkError, match="stream interrupted"):
+        with stream_with_retry(
+            "POST",
+            "https://tts.example.com/synthesize",
+            max_retries=1,
+            base_delay=0,
+            idempotent=False,
+            provider_name="test-mid-stream",
+            client=client,
+        ) as response:
+            for chunk in response.iter_bytes():
+                received.append(chunk)
+
+    client.close()
+    assert len(requests) == 1
+    assert received == [b"partial"]
+
+
+def test_connect_error_is_retried_before_streaming():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("refused")
+        return httpx.Response(200, content=b"audio")
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    with stream_with_retry(
+        "POST",
+        "https://tts.example.com/synthesize",
+        max_retries=1,
+        base_delay=0,
+        idempotent=False,
+        provider_name="test-connect-retry",
+        client=client,
+    ) as response:
+        body = response.read()
+
+    client.close()
+    assert len(attempts) == 2
+    assert body == b"audio"
+
+
+class InterruptedAsyncStream(httpx.AsyncByteStream):
+    async def __aiter__(self):
+        yield b"partial"
+        raise httpx.ReadError("connection dropped")
+
+
+@pytest.mark.asyncio
+async def test_async_stream_retries_connect_error():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("refused")
+        return httpx.Response(200, content=b"audio")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        async with astream_with_retry(
+            "POST",
+            "https://tts.example.com/synthesize",
+            client,
+            max_retries=1,
+            base_delay=0,
+            idempotent=False,
+            provider_name="test-async-connect-retry",
+        ) as response:
+            body = await response.aread()
+
+    assert len(attempts) == 2
+    assert body == b"audio"
+
+
+@pytest.mark.asyncio
+async def test_async_mid_stream_error_is_not_retried():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, stream=InterruptedAsyncStream())
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(NetworkError, match="stream interrupted"):
+            async with astream_with_retry(
+                "POST",
+                "https://tts.example.com/synthesize",
+                client,
+                max_retries=1,
+                base_delay=0,
+                idempotent=False,
+                provider_name="test-async-mid-stream",
+            ) as response:
+                async for _ in response.aiter_bytes():
+                    pass
+
+    assert len(requests) == 1
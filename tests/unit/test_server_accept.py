@@ -0,0 +1,37 @@
+"""Tests for Accept-header negotiation of raw audio in the HTTP server."""
+
+import pytest
+
+pytest.importorskip("matilda_transport")
+
+from aiohttp.test_utils import make_mocked_request  # noqa: E402
+
+from matilda_voice.server import _preferred_raw_audio_type, wants_raw_audio  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        ("audio/mpeg", "audio/mpeg"),
+        ("application/octet-stream", "application/octet-stream"),
+        ("audio/*, */*;q=0.8", "audio/*"),
+        ("application/json, audio/*;q=0.1", None),
+        ("audio/*;q=0, application/json", None),
+        ("application/json;q=0.5, audio/wav", "audio/wav"),
+        ("audio/*, application/json", None),
+        ("*/*", None),
+        ("", None),
+    ],
+)
+def test_preferred_raw_audio_type(accept, expected):
+    assert _preferred_raw_audio_type(accept) == expected
+
+
+def test_mixed_accept_prefers_json():
+    request = make_mocked_request("POST", "/synthesize", headers={"Accept": "application/json, audio/*;q=0.1"})
+    assert wants_raw_audio(request) is False
+
+
+def test_binary_encoding_query_wins():
+    request = make_mocked_request("POST", "/synthesize?encoding=binary", headers={"Accept": "application/json"})
+    assert wants_raw_audio(request) is True
@@ -154,6 +154,12 @@ class TestVoiceRegionAnalysis:
             _, region, _ = analyze_voice("edge_tts", voice)
             assert region == "Indian", f"Voice '{voice}' should be detected as Indian"
 
+    def test_region_detection_ignores_case(self):
+        """Test that lowercase locale codes and region names are recognized."""
+        assert analyze_voice("piper", "en-us-amy-medium")[1] == "American"
+        assert analyze_voice("piper", "en-gb-alan-low")[1] == "British"
+        assert analyze_voice("edge_tts", "voice-irish")[1] == "Irish"
+
     def test_chatterbox_region_detection(self):
         """Test that chatterbox provider voices are detected as Chatterbox region."""
         chatterbox_voices = [
@@ -60,3 +60,9 @@ def test_non_problematic_matches():
     # "jenny" should match inside "jennyneural" (no boundary needed)
     _, _, gender = analyze_voice("provider", "en-US-JennyNeural")
     assert gender == "F", "Should match 'jenny' inside 'JennyNeural'"
+
+
+def test_female_indicator_takes_precedence_over_earlier_male_indicator():
+    """Female indicators win even when a male indicator appears first in the name."""
+    _, _, gender = analyze_voice("provider", "guy-and-jenny-duet")
+    assert gender == "F"